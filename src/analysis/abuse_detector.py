@@ -6,6 +6,7 @@ harassing, or bullying behavior in comments.
 """
 
 from typing import Any, Dict, List, Optional, Set
+import bisect
 import re
 from collections import Counter
 
@@ -72,6 +73,18 @@ class AbuseDetector(Analyzer):
         r"\b(doxxing|dox|expose)\s+(you|your\s+address)",
     ]
 
+    # Pattern lists compiled once at class-definition time so the
+    # detectors never re-enter the re module's cache per call.
+    _DIRECT_ATTACK_RE = [re.compile(p, re.IGNORECASE) for p in DIRECT_ATTACK_PATTERNS]
+    _HARASSMENT_RE = [re.compile(p, re.IGNORECASE) for p in HARASSMENT_PATTERNS]
+    _THREAT_RE = [re.compile(p, re.IGNORECASE) for p in THREAT_PATTERNS]
+    _ALL_PATTERNS_RE = _DIRECT_ATTACK_RE + _HARASSMENT_RE + _THREAT_RE
+
+    # Separator used to join comment texts for batch scanning. It is
+    # neither whitespace nor a word character, so no pattern above can
+    # match across a comment boundary.
+    _BATCH_SEPARATOR = "\x1f"
+
     # Repeated behavior indicators
     REPETITION_INDICATORS = [
         "mentioned",
@@ -110,14 +123,40 @@ class AbuseDetector(Analyzer):
             return self._create_error_result(comment, "Invalid comment")
 
         text = comment.text
-        text_lower = text.lower()
 
-        # Detect different types of abuse
-        direct_attack = self._detect_direct_attack(text)
-        harassment = self._detect_harassment(text)
-        hate_speech = self._detect_hate_speech(text)
-        threats = self._detect_threats(text)
-        repetition = self._detect_repetition(text, comment)
+        return self._build_result(
+            comment,
+            direct_attack=self._detect_direct_attack(text),
+            harassment=self._detect_harassment(text),
+            hate_speech=self._detect_hate_speech(text),
+            threats=self._detect_threats(text),
+            repetition=self._detect_repetition(text, comment),
+        )
+
+    def _build_result(
+        self,
+        comment: Comment,
+        direct_attack: Dict[str, Any],
+        harassment: Dict[str, Any],
+        hate_speech: Dict[str, Any],
+        threats: Dict[str, Any],
+        repetition: Dict[str, Any],
+    ) -> AnalysisResult:
+        """
+        Assemble an AnalysisResult from precomputed indicators.
+
+        Args:
+            comment: The comment that was analyzed
+            direct_attack: Direct attack detection results
+            harassment: Harassment detection results
+            hate_speech: Hate speech detection results
+            threats: Threat detection results
+            repetition: Repetition detection results
+
+        Returns:
+            AnalysisResult with abuse detection data
+        """
+        text_lower = comment.text.lower()
 
         # Calculate overall abuse score
         abuse_score = self._calculate_abuse_score(
@@ -166,13 +205,93 @@ class AbuseDetector(Analyzer):
         """
         Detect abuse in multiple comments.
 
+        Rather than re-running every regex against every comment, the
+        valid comment texts are joined with an unprintable separator and
+        each pattern is scanned once over the whole batch; hits are
+        mapped back to their comment by offset.
+
         Args:
             comments: List of comments to analyze
 
         Returns:
-            List of AnalysisResult objects
+            List of AnalysisResult objects, one per comment in order
         """
-        return [self.analyze(comment) for comment in comments]
+        valid_indices = [
+            i for i, comment in enumerate(comments) if self.validate_comment(comment)
+        ]
+        texts_lower = [comments[i].text.lower() for i in valid_indices]
+
+        attack_hits = self._scan_batch(self._DIRECT_ATTACK_RE, texts_lower)
+        harassment_hits = self._scan_batch(self._HARASSMENT_RE, texts_lower)
+        threat_hits = self._scan_batch(self._THREAT_RE, texts_lower)
+
+        results: List[Optional[AnalysisResult]] = [None] * len(comments)
+        for position, i in enumerate(valid_indices):
+            comment = comments[i]
+            text = comment.text
+            results[i] = self._build_result(
+                comment,
+                direct_attack=self._summarize_matches(attack_hits[position]),
+                harassment=self._summarize_matches(harassment_hits[position]),
+                hate_speech=self._detect_hate_speech(text),
+                threats=self._summarize_matches(threat_hits[position]),
+                repetition=self._detect_repetition(text, comment),
+            )
+
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = self._create_error_result(comments[i], "Invalid comment")
+
+        return results
+
+    def _scan_batch(
+        self, patterns: List["re.Pattern"], texts_lower: List[str]
+    ) -> List[List[str]]:
+        """
+        Run each pattern once over all texts.
+
+        Args:
+            patterns: Compiled regex patterns to scan for
+            texts_lower: Lower-cased comment texts
+
+        Returns:
+            Per-text lists of matched patterns, in pattern order
+        """
+        joined = self._BATCH_SEPARATOR.join(texts_lower)
+
+        starts = []
+        offset = 0
+        for text in texts_lower:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        hits: List[List[str]] = [[] for _ in texts_lower]
+        for regex in patterns:
+            seen: Set[int] = set()
+            for match in regex.finditer(joined):
+                index = bisect.bisect_right(starts, match.start()) - 1
+                if index not in seen:
+                    seen.add(index)
+                    hits[index].append(regex.pattern)
+
+        return hits
+
+    @staticmethod
+    def _summarize_matches(matches: List[str]) -> Dict[str, Any]:
+        """
+        Build a detection dictionary from a list of matched patterns.
+
+        Args:
+            matches: Patterns that matched
+
+        Returns:
+            Dictionary with detection results
+        """
+        return {
+            "detected": len(matches) > 0,
+            "match_count": len(matches),
+            "matches": matches[:3],
+        }
 
     def _detect_direct_attack(self, text: str) -> Dict[str, Any]:
         """
@@ -187,16 +306,11 @@ class AbuseDetector(Analyzer):
         matches = []
         text_lower = text.lower()
 
-        for pattern in self.DIRECT_ATTACK_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                matches.append(pattern)
+        for regex in self._DIRECT_ATTACK_RE:
+            if regex.search(text_lower):
+                matches.append(regex.pattern)
 
-        detected = len(matches) > 0
-        return {
-            "detected": detected,
-            "match_count": len(matches),
-            "matches": matches[:3],
-        }
+        return self._summarize_matches(matches)
 
     def _detect_harassment(self, text: str) -> Dict[str, Any]:
         """
@@ -211,16 +325,11 @@ class AbuseDetector(Analyzer):
         matches = []
         text_lower = text.lower()
 
-        for pattern in self.HARASSMENT_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                matches.append(pattern)
+        for regex in self._HARASSMENT_RE:
+            if regex.search(text_lower):
+                matches.append(regex.pattern)
 
-        detected = len(matches) > 0
-        return {
-            "detected": detected,
-            "match_count": len(matches),
-            "matches": matches[:3],
-        }
+        return self._summarize_matches(matches)
 
     def _detect_hate_speech(self, text: str) -> Dict[str, Any]:
         """
@@ -265,16 +374,11 @@ class AbuseDetector(Analyzer):
         matches = []
         text_lower = text.lower()
 
-        for pattern in self.THREAT_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                matches.append(pattern)
+        for regex in self._THREAT_RE:
+            if regex.search(text_lower):
+                matches.append(regex.pattern)
 
-        detected = len(matches) > 0
-        return {
-            "detected": detected,
-            "match_count": len(matches),
-            "matches": matches[:3],
-        }
+        return self._summarize_matches(matches)
 
     def _detect_repetition(self, text: str, comment: Comment) -> Dict[str, Any]:
         """
@@ -378,15 +482,9 @@ class AbuseDetector(Analyzer):
         """
         matches = []
 
-        all_patterns = (
-            self.DIRECT_ATTACK_PATTERNS
-            + self.HARASSMENT_PATTERNS
-            + self.THREAT_PATTERNS
-        )
-
-        for pattern in all_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                matches.append(pattern)
+        for regex in self._ALL_PATTERNS_RE:
+            if regex.search(text):
+                matches.append(regex.pattern)
 
         # Add hate speech keywords
         for category, keywords in self.HATE_SPEECH_INDICATORS.items():
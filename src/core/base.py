@@ -41,9 +41,10 @@ class Sentiment(str, Enum):
     MIXED = "mixed"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Comment:
-    """Represents a comment from any platform."""
+    """Represents a comment from any platform. Immutable, so one instance
+    can be shared safely across threads and cached fixtures."""
 
     id: str
     text: str
@@ -197,9 +198,10 @@ class AnalysisResult:
         return cls(**data)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Post:
-    """Represents a post from any platform."""
+    """Represents a post from any platform. Immutable, so one instance
+    can be shared safely across threads and cached fixtures."""
 
     id: str
     title: str
@@ -15,12 +15,15 @@ from .error_handler import (
     PlatformError,
     AnalysisError,
     ErrorHandler,
+    backoff,
     create_error_response,
     wrap_errors,
 )
 from .rate_limiter import (
     RateLimiter,
+    SlidingWindowRateLimiter,
     PlatformRateLimiter,
+    parse_rate_limit_headers,
     rate_limit,
     get_global_rate_limiter,
 )
@@ -46,11 +49,14 @@ __all__ = [
     "PlatformError",
     "AnalysisError",
     "ErrorHandler",
+    "backoff",
     "create_error_response",
     "wrap_errors",
     # Rate limiting
     "RateLimiter",
+    "SlidingWindowRateLimiter",
     "PlatformRateLimiter",
+    "parse_rate_limit_headers",
     "rate_limit",
     "get_global_rate_limiter",
     # Authentication
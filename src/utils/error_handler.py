@@ -10,10 +10,30 @@ from functools import wraps
 from datetime import datetime
 import traceback
 import logging
+import random
 
 from ..core.config import get_config
 
 
+def backoff(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """
+    Calculate a full-jitter exponential backoff delay.
+
+    Draws a delay uniformly from [0, min(cap, base * 2**attempt)] so that
+    concurrent clients retrying after the same failure spread out instead
+    of retrying in lockstep.
+
+    Args:
+        attempt: Zero-based retry attempt number
+        base: Base delay in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    return random.random() * min(cap, base * (1 << attempt))
+
+
 class ModerationError(Exception):
     """Base exception for all moderation errors."""
 
@@ -308,10 +328,10 @@ class ErrorHandler:
                         last_error = e
 
                         if attempt < max_retries:
-                            wait_time = backoff_factor * (2**attempt)
+                            wait_time = backoff(attempt, base=backoff_factor)
                             self.logger.warning(
                                 f"Retry {attempt + 1}/{max_retries} for {func.__name__} "
-                                f"after {wait_time}s due to: {str(e)}"
+                                f"after {wait_time:.2f}s due to: {str(e)}"
                             )
                             time.sleep(wait_time)
                         else:
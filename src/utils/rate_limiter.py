@@ -5,9 +5,11 @@ This module provides rate limiting functionality to prevent exceeding
 API rate limits for various social media platforms.
 """
 
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import defaultdict
+import bisect
+import itertools
 import time
 import threading
 
@@ -28,6 +30,7 @@ class RateLimiter:
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
         burst_size: int = 10,
+        clock=time,
     ):
         """
         Initialize rate limiter.
@@ -36,10 +39,13 @@ class RateLimiter:
             requests_per_minute: Maximum requests per minute
             requests_per_hour: Maximum requests per hour
             burst_size: Maximum burst size
+            clock: Time source providing time() and sleep(); tests inject
+                a fake clock instead of patching the time module
         """
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
         self.burst_size = burst_size
+        self._clock = clock
 
         self._tokens_minute: float = float(burst_size)
         self._tokens_hour: float = float(burst_size)
@@ -78,16 +84,16 @@ class RateLimiter:
             RateLimitError: If wait time exceeds threshold
         """
         max_wait_time = 60.0  # Maximum wait time in seconds
-        start_time = time.time()
+        start_time = self._clock.time()
 
         while not self.acquire(tokens):
-            elapsed = time.time() - start_time
+            elapsed = self._clock.time() - start_time
             if elapsed > max_wait_time:
                 raise RateLimitError(
                     f"Rate limit exceeded, waited {elapsed:.2f}s", retry_after=30
                 )
 
-            time.sleep(0.1)
+            self._clock.sleep(0.1)
 
     def get_available_tokens(self) -> tuple[int, int]:
         """
@@ -134,6 +140,126 @@ class RateLimiter:
         self._last_update = now
 
 
+class SlidingWindowRateLimiter:
+    """
+    Sliding-window rate limiter.
+
+    Keeps request timestamps in a contiguous list ordered by arrival and
+    locates the eviction boundary with a binary search, so expired entries
+    are dropped in one O(log n) search plus a single slice delete instead
+    of a Python-level scan over the window population.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 60,
+        window_seconds: float = 60.0,
+        flush_callback: Optional[Callable[[int], None]] = None,
+        flush_interval: Optional[float] = 5.0,
+        clock=time,
+    ):
+        """
+        Initialize sliding-window rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests allowed in the window
+            window_seconds: Window length in seconds
+            flush_callback: Optional callable receiving the batched request
+                delta, e.g. a persistence write to a shared counter store
+            flush_interval: Seconds between background flushes; None
+                disables the background thread (flush() can still be
+                called manually)
+            clock: Time source providing monotonic() and sleep(); tests
+                inject a fake clock instead of patching the time module
+        """
+        self.requests_per_minute = requests_per_minute
+        self.window_seconds = window_seconds
+        self.flush_interval = flush_interval
+        self._clock = clock
+
+        self._timestamps: list = []
+        self._lock = threading.Lock()
+
+        # itertools.count.__next__ is a single C call, so the fetch-add is
+        # atomic under the GIL without taking the lock.
+        self._tick = itertools.count(1).__next__
+        self.request_count = 0
+
+        # Requests recorded since the last flush. Batching the persistence
+        # write keeps record_request() off the I/O path entirely.
+        self._pending = 0
+        self._flush_callback = flush_callback
+
+        if flush_callback is not None and flush_interval is not None:
+            flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            flusher.start()
+
+    def record_request(self) -> None:
+        """Record one request at the current time."""
+        now = self._clock.monotonic()
+        count = self._tick()
+        with self._lock:
+            self._evict(now)
+            self._timestamps.append(now)
+            self._pending += 1
+            # Ticks can arrive out of order across threads; keep the max so
+            # request_count never loses an update.
+            if count > self.request_count:
+                self.request_count = count
+
+    def check_rate_limit(self) -> Dict[str, float]:
+        """
+        Check the current window occupancy.
+
+        Returns:
+            Dict with limit, remaining and reset (monotonic time the
+            oldest in-window request expires)
+        """
+        now = self._clock.monotonic()
+        with self._lock:
+            self._evict(now)
+            in_window = len(self._timestamps)
+            if self._timestamps:
+                reset = self._timestamps[0] + self.window_seconds
+            else:
+                reset = now
+
+        return {
+            "limit": self.requests_per_minute,
+            "remaining": max(self.requests_per_minute - in_window, 0),
+            "reset": reset,
+        }
+
+    def wait_if_needed(self) -> None:
+        """Sleep until the oldest in-window request expires if at the limit."""
+        info = self.check_rate_limit()
+        if info["remaining"] <= 0:
+            self._clock.sleep(max(info["reset"] - self._clock.monotonic(), 0.0))
+
+    def flush(self) -> None:
+        """Hand the batched request delta to the flush callback, if any."""
+        with self._lock:
+            delta, self._pending = self._pending, 0
+
+        if delta and self._flush_callback is not None:
+            self._flush_callback(delta)
+
+    def _flush_loop(self) -> None:
+        """Flush batched deltas periodically. Runs on a daemon thread."""
+        while True:
+            self._clock.sleep(self.flush_interval)
+            self.flush()
+
+    def _evict(self, now: float) -> None:
+        """Drop timestamps that have left the window. Caller holds the lock."""
+        cutoff = now - self.window_seconds
+        # Timestamps are appended in monotonic order, so the boundary is
+        # found by binary search and removed with one slice delete.
+        idx = bisect.bisect_left(self._timestamps, cutoff)
+        if idx:
+            del self._timestamps[:idx]
+
+
 class PlatformRateLimiter:
     """
     Manages rate limiting for multiple platforms.
@@ -148,6 +274,10 @@ class PlatformRateLimiter:
         self._endpoint_limiters: Dict[str, Dict[str, RateLimiter]] = defaultdict(dict)
         self._config = get_config()
 
+        # Guards limiter creation only. Each RateLimiter carries its own
+        # lock, so traffic on different platforms never serializes here.
+        self._registry_lock = threading.Lock()
+
         self._initialize_platform_limiters()
 
     def _initialize_platform_limiters(self) -> None:
@@ -327,13 +457,40 @@ class PlatformRateLimiter:
                 return self._endpoint_limiters[platform][endpoint]
 
         # Fall back to platform limiter
-        if platform in self._limiters:
-            return self._limiters[platform]
+        limiter = self._limiters.get(platform)
+        if limiter is not None:
+            return limiter
+
+        # Register a default limiter for the unknown platform. Double-checked
+        # under the registry lock so concurrent callers share one limiter
+        # instead of each getting a throwaway instance.
+        with self._registry_lock:
+            limiter = self._limiters.get(platform)
+            if limiter is None:
+                limiter = RateLimiter(
+                    requests_per_minute=60, requests_per_hour=1000, burst_size=10
+                )
+                self._limiters[platform] = limiter
 
-        # Create default limiter for unknown platform
-        return RateLimiter(
-            requests_per_minute=60, requests_per_hour=1000, burst_size=10
-        )
+        return limiter
+
+
+def parse_rate_limit_headers(headers: Dict[str, str]) -> tuple[int, int, int]:
+    """
+    Parse standard X-RateLimit-* response headers.
+
+    Args:
+        headers: Response headers containing X-RateLimit-Limit,
+            X-RateLimit-Remaining and X-RateLimit-Reset
+
+    Returns:
+        Tuple of (limit, remaining, reset)
+    """
+    return (
+        int(headers["X-RateLimit-Limit"]),
+        int(headers["X-RateLimit-Remaining"]),
+        int(headers["X-RateLimit-Reset"]),
+    )
 
 
 def rate_limit(platform: str, endpoint: Optional[str] = None, tokens: int = 1):
@@ -7,7 +7,7 @@ import pytest
 import asyncio
 import tempfile
 from typing import Generator, Dict, Any
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 from datetime import datetime, timedelta
 import json
 
@@ -24,6 +24,10 @@ CI_ENV = os.getenv("CI", "false").lower() == "true"
 # Test configuration
 pytest_plugins = ["pytest_asyncio", "pytest_cov", "pytest_mock"]
 
+# NOTE: The sample_*/auth config fixtures in tests/fixtures are session-scoped
+# and return read-only MappingProxyType views. They must not be mutated; tests
+# that need a mutable copy should take dict(fixture) locally.
+
 # Async test configuration
 asyncio_mode = "auto"
 asyncio_default_fixture_loop_scope = "function"
@@ -40,6 +44,11 @@ def can_use_network() -> bool:
     return os.getenv("ALLOW_NETWORK_TESTS", "false").lower() == "true"
 
 
+def requires_network(reason: str = "needs live network access"):
+    """Decorator to skip tests unless ALLOW_NETWORK_TESTS=true"""
+    return pytest.mark.skipif(not can_use_network(), reason=reason)
+
+
 # Fixtures
 
 
@@ -99,14 +108,20 @@ def mock_response(status_code: int = 200, data: Dict = None) -> Mock:
     if data is None:
         data = {"data": {}}
 
-    response = Mock()
-    response.status_code = status_code
+    response = Mock(status_code=status_code, text=json.dumps(data))
     response.json.return_value = data
-    response.text = json.dumps(data)
     response.raise_for_status.return_value = None
     return response
 
 
+@pytest.fixture
+def patched_get(monkeypatch) -> Mock:
+    """Patch requests.get once per test; tests set .return_value/.side_effect"""
+    mock = Mock()
+    monkeypatch.setattr("requests.get", mock)
+    return mock
+
+
 @pytest.fixture
 def mock_session() -> Generator:
     """Create mock requests session"""
@@ -163,10 +178,11 @@ def rate_limit_headers() -> Dict[str, str]:
 @pytest.fixture
 def rate_limit_response() -> Mock:
     """Rate limit error response"""
-    response = Mock()
-    response.status_code = 429
-    response.headers = rate_limit_headers()
-    response.text = json.dumps({"error": {"code": "rate_limit_exceeded"}})
+    response = Mock(
+        status_code=429,
+        headers=rate_limit_headers(),
+        text=json.dumps({"error": {"code": "rate_limit_exceeded"}}),
+    )
     response.json.return_value = {"error": {"code": "rate_limit_exceeded"}}
     return response
 
@@ -186,8 +202,7 @@ def webhook_event() -> Dict[str, Any]:
 @pytest.fixture
 def error_response(error_code: str = "access_token_invalid") -> Mock:
     """Error response for testing"""
-    response = Mock()
-    response.status_code = 401
+    response = Mock(status_code=401)
     response.json.return_value = {
         "error": {"code": error_code, "message": "The access token provided is invalid"}
     }
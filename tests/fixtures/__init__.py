@@ -4,6 +4,7 @@ from .api_mocks import (
     MockInstagramAPI,
     MockMediumAPI,
     MockTikTokAPI,
+    MockWebhookHandler,
     mock_response_factory,
     create_mock_session,
     create_webhook_event,
@@ -24,11 +25,15 @@ from .auth_fixtures import (
     mock_auth_response,
     mock_auth_error,
     auth_session,
+    instagram_auth_config,
+    medium_auth_config,
+    tiktok_auth_config,
     platform_auth_config,
     user_session,
 )
 
 from .data_fixtures import (
+    require_keys,
     sample_comment,
     sample_post,
     sample_user,
@@ -36,16 +41,22 @@ from .data_fixtures import (
     sample_article,
     sample_media,
     sample_comments_list,
+    sample_comments_list_factory,
     sample_posts_list,
+    sample_posts_list_factory,
     sample_videos_list,
+    sample_videos_list_factory,
     sample_articles_list,
+    sample_articles_list_factory,
     sample_media_list,
+    sample_media_list_factory,
     flagged_comment,
     moderation_action,
     sample_analyzed_comment,
     sample_moderation_result,
     sample_rate_limit_info,
     sample_webhook_event,
+    webhook_event,
     sample_error_response,
     sample_pagination_info,
     comment_length_variations,
@@ -57,9 +68,12 @@ from .data_fixtures import (
 )
 
 from .platform_fixtures import (
+    SESSION_SIGNATURES,
+    platform_secret,
     instagram_config,
     medium_config,
     tiktok_config,
+    platform_config,
     twitter_config,
     reddit_config,
     youtube_config,
@@ -71,6 +85,7 @@ from .platform_fixtures import (
     youtube_client,
     mock_rate_limiter,
     mock_moderation_engine,
+    fast_moderation_engine,
     mock_action_executor,
     mock_comment_tracker,
     mock_post_tracker,
@@ -83,9 +98,7 @@ from .platform_fixtures import (
     mock_http_client,
     mock_cache,
     mock_auth_manager,
-    instagram_api_mocks,
-    medium_api_mocks,
-    tiktok_api_mocks,
+    api_mocks,
     mock_request_session,
     mock_async_http_client,
     test_database,
@@ -107,6 +120,7 @@ __all__ = [
     "MockTwitterAPI",
     "MockRedditAPI",
     "MockYouTubeAPI",
+    "MockWebhookHandler",
     "mock_response_factory",
     "create_mock_session",
     "create_webhook_event",
@@ -119,8 +133,12 @@ __all__ = [
     "mock_auth_response",
     "mock_auth_error",
     "auth_session",
+    "instagram_auth_config",
+    "medium_auth_config",
+    "tiktok_auth_config",
     "platform_auth_config",
     "user_session",
+    "require_keys",
     "sample_comment",
     "sample_post",
     "sample_user",
@@ -128,16 +146,22 @@ __all__ = [
     "sample_article",
     "sample_media",
     "sample_comments_list",
+    "sample_comments_list_factory",
     "sample_posts_list",
+    "sample_posts_list_factory",
     "sample_videos_list",
+    "sample_videos_list_factory",
     "sample_articles_list",
+    "sample_articles_list_factory",
     "sample_media_list",
+    "sample_media_list_factory",
     "flagged_comment",
     "moderation_action",
     "sample_analyzed_comment",
     "sample_moderation_result",
     "sample_rate_limit_info",
     "sample_webhook_event",
+    "webhook_event",
     "sample_error_response",
     "sample_pagination_info",
     "comment_length_variations",
@@ -146,9 +170,12 @@ __all__ = [
     "sample_post_metrics",
     "sample_comment_thread",
     "sample_batch_results",
+    "SESSION_SIGNATURES",
+    "platform_secret",
     "instagram_config",
     "medium_config",
     "tiktok_config",
+    "platform_config",
     "twitter_config",
     "reddit_config",
     "youtube_config",
@@ -160,6 +187,7 @@ __all__ = [
     "youtube_client",
     "mock_rate_limiter",
     "mock_moderation_engine",
+    "fast_moderation_engine",
     "mock_action_executor",
     "mock_comment_tracker",
     "mock_post_tracker",
@@ -172,9 +200,7 @@ __all__ = [
     "mock_http_client",
     "mock_cache",
     "mock_auth_manager",
-    "instagram_api_mocks",
-    "medium_api_mocks",
-    "tiktok_api_mocks",
+    "api_mocks",
     "mock_request_session",
     "mock_async_http_client",
     "test_database",
@@ -1,7 +1,9 @@
 """API Mock Objects for Testing"""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from unittest.mock import Mock, AsyncMock
+import hashlib
+import hmac
 import json
 import time
 
@@ -14,6 +16,17 @@ class MockInstagramAPI:
         self.called_endpoints = []
         self._media_cache = {}
         self._comments_cache = {}
+        # Built once and shared across calls; the tuple is read-only so
+        # callers cannot mutate the canned response between tests.
+        self._canned_comments = tuple(
+            {
+                "id": f"comment_{i}",
+                "text": f"Test comment {i}",
+                "user": {"username": f"testuser{i}", "id": f"user_{i}"},
+                "timestamp": str(int(time.time())),
+            }
+            for i in range(5)
+        )
 
     def get_media(self, media_id: str) -> Dict[str, Any]:
         """Mock getting Instagram media"""
@@ -34,7 +47,7 @@ class MockInstagramAPI:
             "comments_count": 50,
         }
 
-    def get_media_comments(self, media_id: str, **kwargs) -> list:
+    def get_media_comments(self, media_id: str, **kwargs) -> Sequence[Dict[str, Any]]:
         """Mock getting Instagram comments"""
         self.call_count += 1
         self.called_endpoints.append(("get_media_comments", {"media_id": media_id}))
@@ -42,15 +55,7 @@ class MockInstagramAPI:
         if media_id in self._comments_cache:
             return self._comments_cache[media_id]
 
-        return [
-            {
-                "id": f"comment_{i}",
-                "text": f"Test comment {i}",
-                "user": {"username": f"testuser{i}", "id": f"user_{i}"},
-                "timestamp": str(int(time.time())),
-            }
-            for i in range(5)
-        ]
+        return self._canned_comments
 
     def delete_comment(self, comment_id: str) -> bool:
         """Mock deleting Instagram comment"""
@@ -278,6 +283,86 @@ def create_mock_session(platform: str) -> Mock:
     return session
 
 
+class MockWebhookHandler:
+    """Mock webhook handler for testing"""
+
+    REQUIRED_FIELDS = ("comment_id",)
+
+    def __init__(self, secret):
+        self.secret = secret
+        self.handlers: Dict[str, Any] = {}
+        self.handle_comment_created = Mock()
+
+        # Normalize the secret to bytes once so signing and verification
+        # skip the str-to-bytes conversion on every call.
+        if isinstance(secret, str):
+            self._secret_bytes = secret.encode("ascii")
+        else:
+            self._secret_bytes = secret
+
+    def generate_signature(self, payload: bytes) -> str:
+        """Generate the hex HMAC-SHA256 signature for a payload"""
+        return hmac.new(self._secret_bytes, payload, hashlib.sha256).hexdigest()
+
+    def verify_signature(self, payload: bytes, signature) -> bool:
+        """Check a raw or hex payload signature in constant time"""
+        expected = hmac.new(self._secret_bytes, payload, hashlib.sha256).digest()
+        if isinstance(signature, str):
+            # Hex signatures are decoded so both forms compare against
+            # the raw digest without re-encoding the expected value.
+            try:
+                signature = bytes.fromhex(signature)
+            except ValueError:
+                return False
+        # compare_digest runs a fixed-stride C loop, so a mismatch leaks
+        # nothing about how far the comparison got.
+        return hmac.compare_digest(expected, signature)
+
+    def register_handler(self, event_type: str, handler) -> None:
+        """Register a callback for an event type"""
+        self.handlers[event_type] = handler
+
+    def sign_event(self, event) -> bytes:
+        """Raw HMAC-SHA256 signature over an event's canonical payload"""
+        payload = getattr(event, "payload", event)
+        return hmac.new(
+            self._secret_bytes, self._payload_bytes(payload), hashlib.sha256
+        ).digest()
+
+    @staticmethod
+    def _payload_bytes(payload: Dict[str, Any]) -> bytes:
+        """Canonical byte serialization used when signing payload dicts"""
+        return json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+
+    def handle_event(self, event_type: str, event, signature=None) -> bool:
+        """
+        Validate an event payload and dispatch it to its handler.
+
+        When a signature is supplied it is checked against the canonical
+        payload bytes first; events that fail verification are rejected
+        without dispatching.
+        """
+        payload = getattr(event, "payload", event)
+
+        if signature is not None and not self.verify_signature(
+            self._payload_bytes(payload), signature
+        ):
+            return False
+
+        for field in self.REQUIRED_FIELDS:
+            if field not in payload:
+                raise ValueError(f"Required field missing: {field}")
+
+        handler = self.handlers.get(event_type)
+        if handler is not None:
+            handler(event)
+
+        if event_type == "comment.created":
+            self.handle_comment_created(event)
+
+        return True
+
+
 class MockWebhookEvent:
     """Mock webhook event for testing"""
 
@@ -1,220 +1,313 @@
 """Authentication Test Fixtures"""
 
-from typing import Dict, Any, Generator
+import functools
+import json
+from collections import namedtuple
+from dataclasses import dataclass, field
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Any, Generator, Mapping, Optional
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import itertools
 import time
 
 
+def __getattr__(name):
+    # PEP 562: no fixture here constructs a real Mock anymore, so defer the
+    # unittest.mock import until something actually asks for it.
+    if name in {"Mock", "MagicMock", "patch"}:
+        import unittest.mock as _mock
+
+        return getattr(_mock, name)
+    raise AttributeError(name)
+
+# Token fixtures only need unique/ordered suffixes, not real timestamps, so
+# snapshot the clock once and increment a counter instead of calling
+# time.time() per fixture.
+_BASE_TS = int(time.time())
+_TOKEN_COUNTER = itertools.count()
+
+
+def _next_token_suffix() -> int:
+    return _BASE_TS + next(_TOKEN_COUNTER)
+
+
+_OAUTH_ACCESS_TOKEN = f"valid_token_{_BASE_TS}"
+_OAUTH_REFRESH_TOKEN = f"refresh_token_{_BASE_TS}"
+
+# Invariant part of create_auth_mock's payload; merged with the varying
+# fields per call.
+_AUTH_MOCK_BASE = MappingProxyType({"token_type": "Bearer"})
+
+
+class _FakeResponse(SimpleNamespace):
+    """Cheap stand-in for a requests.Response-shaped Mock.
+
+    These fixtures only need attribute access and precomputed callables;
+    building a full Mock (child specs, call tracking) is much slower. Use a
+    real Mock only when a test asserts on calls.
+    """
+
+# Scope tuples shared by the auth configs; tuples because they are never
+# mutated and a module-level constant avoids a per-call list allocation.
+_INSTAGRAM_SCOPES = ("user_profile", "comments", "likes")
+_MEDIUM_SCOPES = ("basicProfile", "publishPost", "listPublications")
+_TIKTOK_SCOPES = ("user.info.basic", "video.list", "comment.read", "comment.manage")
+
+# Read-only config dicts shared across the session; copy with dict(...) if a
+# test needs to mutate one.
+_OAUTH_CREDENTIALS = {
+    "client_id": "test_client_id",
+    "client_secret": "test_client_secret",
+    "redirect_uri": "http://localhost:8080/callback",
+}
+
+_INSTAGRAM_AUTH_CONFIG = {
+    "client_id": "test_instagram_client_id",
+    "client_secret": "test_instagram_client_secret",
+    "redirect_uri": "http://localhost:8080/callback",
+    "scopes": _INSTAGRAM_SCOPES,
+}
+
+_MEDIUM_AUTH_CONFIG = {
+    "client_id": "test_medium_client_id",
+    "client_secret": "test_medium_client_secret",
+    "redirect_uri": "http://localhost:8080/callback",
+    "scopes": _MEDIUM_SCOPES,
+}
+
+_TIKTOK_AUTH_CONFIG = {
+    "client_key": "test_tiktok_client_key",
+    "client_secret": "test_tiktok_client_secret",
+    "redirect_uri": "http://localhost:8080/callback",
+    "scopes": _TIKTOK_SCOPES,
+}
+
+_AUTH_ERROR_MESSAGES = MappingProxyType(
+    {
+        "invalid_token": "The access token provided is invalid",
+        "expired_token": "The access token has expired",
+        "invalid_client": "Client authentication failed",
+        "invalid_grant": "Invalid grant type",
+    }
+)
+
+# Pre-serialized response bodies keyed by error type so the fixture does a
+# single lookup instead of re-serializing JSON per call.
+_AUTH_ERROR_JSON_CACHE = {
+    k: json.dumps({"error": {"code": k, "message": v}})
+    for k, v in _AUTH_ERROR_MESSAGES.items()
+}
+
+
 @pytest.fixture
 def valid_auth_token() -> str:
     """Valid authentication token for testing"""
-    return f"valid_test_token_{int(time.time())}"
+    return f"valid_test_token_{_next_token_suffix()}"
 
 
 @pytest.fixture
 def expired_auth_token() -> str:
     """Expired authentication token for testing"""
-    return f"expired_token_{int(time.time() - 100000)}"
+    return f"expired_token_{_BASE_TS - 100000}"
 
 
-@pytest.fixture
-def auth_headers(auth_token: str) -> Dict[str, str]:
-    """Authentication headers fixture"""
-    return {"Authorization": f"Bearer {auth_token}", "Content-Type": "application/json"}
+@functools.lru_cache(maxsize=16)
+def _build_headers(token: str) -> Mapping[str, str]:
+    return MappingProxyType(
+        {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    )
 
 
 @pytest.fixture
-def oauth_credentials() -> Dict[str, str]:
-    """OAuth credentials for testing"""
-    return {
-        "client_id": "test_client_id",
-        "client_secret": "test_client_secret",
-        "redirect_uri": "http://localhost:8080/callback",
-    }
+def auth_headers(valid_auth_token: str) -> Mapping[str, str]:
+    """Authentication headers for the valid test token"""
+    return _build_headers(valid_auth_token)
 
 
-@pytest.fixture
-def mock_oauth_flow():
-    """Mock OAuth 2.0 authentication flow"""
-    auth_state = {}
-    auth_code = "test_auth_code_123"
-    access_token = f"valid_token_{int(time.time())}"
-    refresh_token = f"refresh_token_{int(time.time())}"
-
-    def flow_generator():
-        # Initial authorization request
-        yield {
+@pytest.fixture(scope="session")
+def oauth_credentials() -> Mapping[str, str]:
+    """OAuth credentials for testing (read-only)"""
+    return MappingProxyType(_OAUTH_CREDENTIALS)
+
+
+OAuthSteps = namedtuple("OAuthSteps", "init callback token refresh")
+
+# The OAuth flow stages are deterministic once _BASE_TS is frozen, so build
+# them once; mock_oauth_flow hands out the same named steps to every test.
+_FLOW_STAGES = OAuthSteps(
+    # Initial authorization request
+    MappingProxyType(
+        {
             "state": "test_state_123",
             "auth_url": "https://auth.example.com/authorize",
             "client_id": "test_client_id",
             "redirect_uri": "http://localhost:8080/callback",
         }
-
-        # Callback with authorization code
-        yield {"code": auth_code, "state": "test_state_123"}
-
-        # Token exchange
-        yield {
-            "access_token": access_token,
-            "refresh_token": refresh_token,
+    ),
+    # Callback with authorization code
+    MappingProxyType({"code": "test_auth_code_123", "state": "test_state_123"}),
+    # Token exchange
+    MappingProxyType(
+        {
+            "access_token": _OAUTH_ACCESS_TOKEN,
+            "refresh_token": _OAUTH_REFRESH_TOKEN,
             "expires_in": 3600,
             "token_type": "Bearer",
             "scope": "user.info.basic video.list comment.read",
         }
-
-        # Token refresh
-        yield {
-            "access_token": f"new_token_{int(time.time())}",
-            "refresh_token": f"new_refresh_{int(time.time())}",
+    ),
+    # Token refresh
+    MappingProxyType(
+        {
+            "access_token": f"new_token_{_BASE_TS}",
+            "refresh_token": f"new_refresh_{_BASE_TS}",
             "expires_in": 3600,
         }
+    ),
+)
 
-    return flow_generator
 
+@pytest.fixture(scope="session")
+def mock_oauth_flow():
+    """Mock OAuth 2.0 authentication flow as named steps"""
+    return _FLOW_STAGES
 
-@pytest.fixture
-def mock_token_manager():
-    """Mock token manager for testing"""
-    manager = Mock()
-    manager.storage = {}
 
-    def get_token(user_id: str) -> str:
-        return manager.storage.get(user_id, {}).get("access_token")
+@dataclass
+class _FakeTokenManager:
+    """Plain token manager stand-in; avoids Mock's attribute hooks."""
+
+    storage: Dict[str, Dict] = field(default_factory=dict)
+
+    def get_token(self, user_id: str) -> str:
+        return self.storage.get(user_id, {}).get("access_token")
 
-    def save_token(user_id: str, token_data: Dict):
-        manager.storage[user_id] = token_data
+    def save_token(self, user_id: str, token_data: Dict) -> None:
+        self.storage[user_id] = token_data
 
-    def is_token_expired(user_id: str) -> bool:
-        if user_id not in manager.storage:
+    def is_token_expired(self, user_id: str) -> bool:
+        if user_id not in self.storage:
             return True
-        expires_at = manager.storage[user_id].get("expires_at", 0)
-        return time.time() > expires_at
+        return time.time() > self.storage[user_id].get("expires_at", 0)
 
-    def refresh_token(user_id: str) -> Dict:
+    def refresh_token(self, user_id: str) -> Dict:
+        suffix = _next_token_suffix()
         return {
-            "access_token": f"new_token_{int(time.time())}",
-            "refresh_token": f"new_refresh_{int(time.time())}",
+            "access_token": f"new_token_{suffix}",
+            "refresh_token": f"new_refresh_{suffix}",
             "expires_in": 3600,
         }
 
-    manager.get_token = get_token
-    manager.save_token = save_token
-    manager.is_token_expired = is_token_expired
-    manager.refresh_token = refresh_token
-    manager.storage = {}
 
-    return manager
+@pytest.fixture
+def mock_token_manager():
+    """Mock token manager for testing"""
+    # Function-scoped on purpose: storage is mutated by tests.
+    return _FakeTokenManager()
 
 
-@pytest.fixture
-def instagram_auth_config() -> Dict[str, Any]:
-    """Instagram authentication configuration"""
-    return {
-        "client_id": "test_instagram_client_id",
-        "client_secret": "test_instagram_client_secret",
-        "redirect_uri": "http://localhost:8080/callback",
-        "scopes": ["user_profile", "comments", "likes"],
-    }
+@pytest.fixture(scope="session")
+def instagram_auth_config() -> Mapping[str, Any]:
+    """Instagram authentication configuration (read-only)"""
+    return MappingProxyType(_INSTAGRAM_AUTH_CONFIG)
 
 
-@pytest.fixture
-def medium_auth_config() -> Dict[str, Any]:
-    """Medium authentication configuration"""
-    return {
-        "client_id": "test_medium_client_id",
-        "client_secret": "test_medium_client_secret",
-        "redirect_uri": "http://localhost:8080/callback",
-        "scopes": ["basicProfile", "publishPost", "listPublications"],
-    }
+@pytest.fixture(scope="session")
+def medium_auth_config() -> Mapping[str, Any]:
+    """Medium authentication configuration (read-only)"""
+    return MappingProxyType(_MEDIUM_AUTH_CONFIG)
 
 
-@pytest.fixture
-def tiktok_auth_config() -> Dict[str, Any]:
-    """TikTok authentication configuration"""
-    return {
-        "client_key": "test_tiktok_client_key",
-        "client_secret": "test_tiktok_client_secret",
-        "redirect_uri": "http://localhost:8080/callback",
-        "scopes": ["user.info.basic", "video.list", "comment.read", "comment.manage"],
-    }
+@pytest.fixture(scope="session")
+def tiktok_auth_config() -> Mapping[str, Any]:
+    """TikTok authentication configuration (read-only)"""
+    return MappingProxyType(_TIKTOK_AUTH_CONFIG)
+
+
+_AUTH_RESPONSE_BODY = {
+    "access_token": "test_access_token_123",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "refresh_token": "test_refresh_token_456",
+}
+_AUTH_RESPONSE_TEXT = json.dumps(_AUTH_RESPONSE_BODY)
 
 
 @pytest.fixture
-def mock_auth_response() -> Mock:
+def mock_auth_response() -> _FakeResponse:
     """Mock successful authentication response"""
-    response = Mock()
-    response.status_code = 200
-    response.json.return_value = {
-        "access_token": "test_access_token_123",
-        "token_type": "Bearer",
-        "expires_in": 3600,
-        "refresh_token": "test_refresh_token_456",
-    }
-    response.text = '{"access_token": "test_access_token_123"}'
-    response.raise_for_status.return_value = None
-    return response
+    return _FakeResponse(
+        status_code=200,
+        json=lambda p=_AUTH_RESPONSE_BODY: p,
+        text=_AUTH_RESPONSE_TEXT,
+        raise_for_status=lambda: None,
+    )
 
 
-@pytest.fixture
-def mock_auth_error(error_type: str = "invalid_token") -> Mock:
-    """Mock authentication error response"""
-    error_messages = {
-        "invalid_token": "The access token provided is invalid",
-        "expired_token": "The access token has expired",
-        "invalid_client": "Client authentication failed",
-        "invalid_grant": "Invalid grant type",
-    }
+def _raise_auth_failed():
+    raise Exception("Authentication failed")
 
-    response = Mock()
-    response.status_code = 401
-    response.json.return_value = {
-        "error": {
-            "code": error_type,
-            "message": error_messages.get(error_type, "Authentication failed"),
-        }
-    }
-    error_msg = error_messages.get(error_type, "Authentication failed")
-    response.text = (
-        '{"error": {"code": "' + error_type + '", "message": "' + error_msg + '"}}'
+
+def _build_auth_error(error_type: str = "invalid_token") -> _FakeResponse:
+    """Build a 401 response for an auth error code"""
+    error_msg = _AUTH_ERROR_MESSAGES.get(error_type, "Authentication failed")
+    payload = {"error": {"code": error_type, "message": error_msg}}
+    text = _AUTH_ERROR_JSON_CACHE.get(error_type) or json.dumps(payload)
+    return _FakeResponse(
+        status_code=401,
+        json=lambda p=payload: p,
+        text=text,
+        raise_for_status=_raise_auth_failed,
     )
-    response.raise_for_status.side_effect = Exception("Authentication failed")
-    return response
+
+
+@pytest.fixture
+def mock_auth_error():
+    """Factory fixture for authentication error responses"""
+    return _build_auth_error
 
 
 @pytest.fixture
 def auth_session() -> Generator:
     """Create a mock authentication session"""
-    session = Mock()
-    session.access_token = "test_token_123"
-    session.token_expires_at = time.time() + 3600
-    session.is_authenticated = True
+    session = SimpleNamespace(
+        access_token="test_token_123",
+        token_expires_at=time.time() + 3600,
+        is_authenticated=True,
+        cleanup=lambda: None,
+    )
 
     yield session
 
     session.cleanup()
 
 
-@pytest.fixture(params=["instagram", "medium", "tiktok"])
+@pytest.fixture(
+    params=["instagram", "medium", "tiktok"],
+    ids=["plat-ig", "plat-med", "plat-tt"],
+    scope="session",
+)
 def platform_auth_config(request):
     """Parameterized fixture for platform auth configs"""
-    configs = {
-        "instagram": instagram_auth_config,
-        "medium": medium_auth_config,
-        "tiktok": tiktok_auth_config,
-    }
-    return configs[request.param]
+    # Resolve through pytest so the session-scoped config fixtures are
+    # cached per platform instead of handing back the fixture function.
+    return request.getfixturevalue(f"{request.param}_auth_config")
 
 
 def create_auth_mock(
-    platform: str, token: str = "test_token_123", expires_in: int = 3600
+    platform: str,
+    token: str = "test_token_123",
+    expires_in: int = 3600,
+    ts: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Create authentication mock for a platform"""
     return {
+        **_AUTH_MOCK_BASE,
         "access_token": token,
-        "token_type": "Bearer",
         "expires_in": expires_in,
-        "refresh_token": f"refresh_token_{int(time.time())}",
+        "refresh_token": "refresh_token_{}".format(
+            ts if ts is not None else _next_token_suffix()
+        ),
         "platform": platform,
     }
 
@@ -222,12 +315,14 @@ def create_auth_mock(
 @pytest.fixture
 def user_session() -> Generator:
     """Create a mock user session"""
-    session = Mock()
-    session.user_id = "test_user_123"
-    session.username = "testuser"
-    session.display_name = "Test User"
-    session.profile_picture = "https://example.com/avatar.jpg"
-    session.is_verified = True
+    session = SimpleNamespace(
+        user_id="test_user_123",
+        username="testuser",
+        display_name="Test User",
+        profile_picture="https://example.com/avatar.jpg",
+        is_verified=True,
+        logout=lambda: None,
+    )
 
     yield session
 
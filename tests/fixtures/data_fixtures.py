@@ -1,225 +1,462 @@
 """Sample Test Data Fixtures"""
 
-from typing import Dict, Any, List
+import functools
+import time
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Tuple
 import pytest
 from datetime import datetime, timedelta
 
-
-@pytest.fixture
-def sample_comment() -> Dict[str, Any]:
-    """Sample comment data for testing"""
-    return {
-        "id": "comment_test_123",
-        "text": "This is a test comment",
-        "user_id": "user_test_456",
-        "username": "testuser",
-        "created_at": "2025-01-08T10:00:00Z",
-        "like_count": 10,
+# Cache of the last whole-second ISO timestamp; fixtures stamp the same
+# second thousands of times per run, so format it at most once per second.
+_LAST_TS = [0, ""]
+
+
+def require_keys(obj: Mapping[str, Any], keys: Iterable[str]) -> None:
+    """Assert obj has every key, reporting all missing ones in one go"""
+    missing = set(keys) - set(obj.keys())
+    assert not missing, f"missing keys: {sorted(missing)}"
+
+
+def _now_iso() -> str:
+    t = int(time.time())
+    if t != _LAST_TS[0]:
+        _LAST_TS[0] = t
+        _LAST_TS[1] = datetime.fromtimestamp(t).isoformat()
+    return _LAST_TS[1]
+
+
+_DEFAULT_TAGS = ("test", "moderation")
+
+# Module-level constants backing the read-only sample fixtures below.  The
+# fixtures expose them as MappingProxyType views at session scope, so each
+# dict is allocated once per process; tests that need to mutate a sample
+# should copy it locally with dict(...).
+_SAMPLE_COMMENT = {
+    "id": "comment_test_123",
+    "text": "This is a test comment",
+    "user_id": "user_test_456",
+    "username": "testuser",
+    "created_at": "2025-01-08T10:00:00Z",
+    "like_count": 10,
+    "reply_count": 2,
+    "is_pinned": False,
+}
+
+_SAMPLE_POST = {
+    "id": "post_test_789",
+    "title": "Test Post Title",
+    "content": "<p>This is test post content</p>",
+    "author_id": "user_test_456",
+    "created_at": "2025-01-08T09:00:00Z",
+    "tags": _DEFAULT_TAGS,
+    "like_count": 100,
+    "comment_count": 25,
+}
+
+_SAMPLE_USER = {
+    "id": "user_test_456",
+    "username": "testuser",
+    "display_name": "Test User",
+    "profile_picture": "https://example.com/avatar.jpg",
+    "is_verified": True,
+    "follower_count": 1000,
+    "following_count": 500,
+}
+
+_SAMPLE_VIDEO = {
+    "id": "video_test_012",
+    "title": "Test Video Title",
+    "description": "Test video description",
+    "url": "https://example.com/video.mp4",
+    "thumbnail": "https://example.com/thumb.jpg",
+    "duration": 60,
+    "view_count": 1000,
+    "like_count": 500,
+    "comment_count": 100,
+    "created_at": "2025-01-08T08:00:00Z",
+}
+
+_SAMPLE_ARTICLE = {
+    "id": "article_test_123",
+    "title": "Test Article",
+    "content": "<p>Test article content</p>",
+    "contentFormat": "html",
+    "authorId": "user_test_456",
+    "tags": _DEFAULT_TAGS,
+    "publishedAt": 1234567890000,
+    "url": "https://medium.com/p/test-article",
+}
+
+_SAMPLE_MEDIA = {
+    "id": "media_test_456",
+    "caption": "Test caption",
+    "media_type": "CAROUSEL_ALBUM",
+    "media_url": "https://instagram.com/test.jpg",
+    "thumbnail_url": "https://instagram.com/thumb.jpg",
+    "timestamp": 1234567890000,
+}
+
+_SAMPLE_RATE_LIMIT_INFO = {
+    "limit": 100,
+    "remaining": 95,
+    "reset": 1234567890,
+    "reset_time": datetime.fromtimestamp(1234567890).isoformat(),
+}
+
+_SAMPLE_PAGINATION_INFO = {
+    "page": 1,
+    "page_size": 20,
+    "total_count": 100,
+    "total_pages": 5,
+    "next_page_token": "next_page_token_123",
+    "has_next": True,
+}
+
+_SAMPLE_USER_PROFILE = {
+    "id": "user_profile_123",
+    "username": "testuser",
+    "display_name": "Test User",
+    "bio": "This is a test bio",
+    "profile_picture": "https://example.com/avatar.jpg",
+    "is_verified": True,
+    "follower_count": 1000,
+    "following_count": 500,
+    "posts_count": 100,
+}
+
+_SAMPLE_POST_METRICS = {
+    "id": "post_metrics_123",
+    "like_count": 1000,
+    "comment_count": 100,
+    "share_count": 50,
+    "view_count": 10000,
+    "engagement_rate": 0.15,
+}
+
+_SAMPLE_COMMENT_THREAD = {
+    "parent_comment": {
+        "id": "comment_parent_123",
+        "text": "Parent comment",
+        "user_id": "user_parent_456",
         "reply_count": 2,
-        "is_pinned": False,
-    }
+    },
+    "replies": (
+        {
+            "id": "comment_reply_1",
+            "text": "Reply 1",
+            "user_id": "user_reply_1",
+            "parent_id": "comment_parent_123",
+        },
+        {
+            "id": "comment_reply_2",
+            "text": "Reply 2",
+            "user_id": "user_reply_2",
+            "parent_id": "comment_parent_123",
+        },
+    ),
+    "total_replies": 2,
+}
 
+_ERROR_RESPONSE_MESSAGES = MappingProxyType(
+    {
+        "access_token_invalid": "The access token provided is invalid",
+        "expired_token": "The access token has expired",
+        "rate_limit_exceeded": "Rate limit exceeded",
+        "invalid_grant": "Invalid grant type",
+        "resource_not_found": "Resource not found",
+        "forbidden": "Insufficient permissions",
+    }
+)
+
+_SAMPLE_BATCH_RESULTS = {
+    "total_processed": 25,
+    "successful": 23,
+    "failed": 2,
+    "errors": [
+        {"item_id": "item_5", "error": "Rate limit exceeded"},
+        {"item_id": "item_12", "error": "Resource not found"},
+    ],
+}
+
+# Maximum number of items the list fixtures can materialize from templates
+_MAX_LIST_ITEMS = 32
+
+# Single base-time snapshot shared by all list templates; the hourly offsets
+# used by videos/articles/media are derived from it once at import time.
+_LIST_BASE_TIME = datetime.now()
+_BASE_TIME_ISO = _LIST_BASE_TIME.isoformat()
+_HOURLY_OFFSET_ISO = tuple(
+    (_LIST_BASE_TIME + timedelta(hours=i)).isoformat() for i in range(_MAX_LIST_ITEMS)
+)
+_HOURLY_OFFSET_MS = tuple(
+    int((_LIST_BASE_TIME + timedelta(hours=i)).timestamp() * 1000)
+    for i in range(_MAX_LIST_ITEMS)
+)
+
+_COMMENT_TEMPLATES = tuple(
+    {
+        "id": f"comment_{i}",
+        "text": f"Test comment {i}",
+        "user_id": f"user_{i}",
+        "username": f"testuser{i}",
+        "like_count": i * 10,
+        "reply_count": i,
+    }
+    for i in range(_MAX_LIST_ITEMS)
+)
+
+_POST_TEMPLATES = tuple(
+    {
+        "id": f"post_{i}",
+        "title": f"Test Post {i}",
+        "content": f"<p>Test content {i}</p>",
+        "author_id": f"user_{i}",
+        "tags": ["test", f"tag{i}"],
+        "like_count": i * 50,
+        "comment_count": i * 10,
+    }
+    for i in range(_MAX_LIST_ITEMS)
+)
+
+_VIDEO_TEMPLATES = tuple(
+    {
+        "id": f"video_{i}",
+        "title": f"Test Video {i}",
+        "description": f"Test description {i}",
+        "url": f"https://example.com/video{i}.mp4",
+        "thumbnail": f"https://example.com/thumb{i}.jpg",
+        "duration": 60 + i * 10,
+        "view_count": (i + 1) * 500,
+        "like_count": (i + 1) * 100,
+        "comment_count": (i + 1) * 10,
+        "created_at": _HOURLY_OFFSET_ISO[i],
+    }
+    for i in range(_MAX_LIST_ITEMS)
+)
+
+_ARTICLE_TEMPLATES = tuple(
+    {
+        "id": f"article_{i}",
+        "title": f"Test Article {i}",
+        "content": f"<p>Test content {i}</p>",
+        "contentFormat": "html",
+        "authorId": f"user_{i}",
+        "tags": ["test", f"tag{i}"],
+        "publishedAt": _HOURLY_OFFSET_MS[i],
+        "url": f"https://medium.com/p/test-article-{i}",
+    }
+    for i in range(_MAX_LIST_ITEMS)
+)
 
-@pytest.fixture
-def sample_post() -> Dict[str, Any]:
-    """Sample post/article data for testing"""
-    return {
-        "id": "post_test_789",
-        "title": "Test Post Title",
-        "content": "<p>This is test post content</p>",
-        "author_id": "user_test_456",
-        "created_at": "2025-01-08T09:00:00Z",
-        "tags": ["test", "moderation"],
-        "like_count": 100,
-        "comment_count": 25,
+_MEDIA_TEMPLATES = tuple(
+    {
+        "id": f"media_{i}",
+        "caption": f"Test caption {i}",
+        "media_type": "CAROUSEL_ALBUM",
+        "media_url": f"https://instagram.com/test{i}.jpg",
+        "thumbnail_url": f"https://instagram.com/thumb{i}.jpg",
+        "timestamp": _HOURLY_OFFSET_MS[i],
     }
+    for i in range(_MAX_LIST_ITEMS)
+)
 
 
-@pytest.fixture
-def sample_user() -> Dict[str, Any]:
-    """Sample user data for testing"""
-    return {
-        "id": "user_test_456",
-        "username": "testuser",
-        "display_name": "Test User",
-        "profile_picture": "https://example.com/avatar.jpg",
-        "is_verified": True,
-        "follower_count": 1000,
-        "following_count": 500,
-    }
+@pytest.fixture(scope="session")
+def sample_comment() -> Mapping[str, Any]:
+    """Sample comment data for testing (read-only)"""
+    return MappingProxyType(_SAMPLE_COMMENT)
 
 
-@pytest.fixture
-def sample_video() -> Dict[str, Any]:
-    """Sample video data for testing"""
-    return {
-        "id": "video_test_012",
-        "title": "Test Video Title",
-        "description": "Test video description",
-        "url": "https://example.com/video.mp4",
-        "thumbnail": "https://example.com/thumb.jpg",
-        "duration": 60,
-        "view_count": 1000,
-        "like_count": 500,
-        "comment_count": 100,
-        "created_at": "2025-01-08T08:00:00Z",
-    }
+@pytest.fixture(scope="session")
+def sample_post() -> Mapping[str, Any]:
+    """Sample post/article data for testing (read-only)"""
+    return MappingProxyType(_SAMPLE_POST)
 
 
-@pytest.fixture
-def sample_article() -> Dict[str, Any]:
-    """Sample article data for testing (Medium specific)"""
-    return {
-        "id": "article_test_123",
-        "title": "Test Article",
-        "content": "<p>Test article content</p>",
-        "contentFormat": "html",
-        "authorId": "user_test_456",
-        "tags": ["test", "moderation"],
-        "publishedAt": 1234567890000,
-        "url": "https://medium.com/p/test-article",
-    }
+@pytest.fixture(scope="session")
+def sample_user() -> Mapping[str, Any]:
+    """Sample user data for testing (read-only)"""
+    return MappingProxyType(_SAMPLE_USER)
 
 
-@pytest.fixture
-def sample_media() -> Dict[str, Any]:
-    """Sample media data for testing (Instagram specific)"""
-    return {
-        "id": "media_test_456",
-        "caption": "Test caption",
-        "media_type": "CAROUSEL_ALBUM",
-        "media_url": "https://instagram.com/test.jpg",
-        "thumbnail_url": "https://instagram.com/thumb.jpg",
-        "timestamp": 1234567890000,
-    }
+@pytest.fixture(scope="session")
+def sample_video() -> Mapping[str, Any]:
+    """Sample video data for testing (read-only)"""
+    return MappingProxyType(_SAMPLE_VIDEO)
 
 
-@pytest.fixture
-def sample_comments_list(count: int = 5) -> List[Dict[str, Any]]:
-    """Generate a list of sample comments"""
-    comments = []
-    for i in range(count):
-        comments.append(
+@pytest.fixture(scope="session")
+def sample_article() -> Mapping[str, Any]:
+    """Sample article data for testing (Medium specific) (read-only)"""
+    return MappingProxyType(_SAMPLE_ARTICLE)
+
+
+@pytest.fixture(scope="session")
+def sample_media() -> Mapping[str, Any]:
+    """Sample media data for testing (Instagram specific) (read-only)"""
+    return MappingProxyType(_SAMPLE_MEDIA)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_comments_list(count: int = 5) -> Tuple[Mapping[str, Any], ...]:
+    now = _now_iso()
+    # Cycle the template pool so counts above _MAX_LIST_ITEMS still yield
+    # the requested number of comments, with unique ids throughout.
+    return tuple(
+        MappingProxyType(
             {
+                **_COMMENT_TEMPLATES[i % _MAX_LIST_ITEMS],
                 "id": f"comment_{i}",
-                "text": f"Test comment {i}",
-                "user_id": f"user_{i}",
-                "username": f"testuser{i}",
-                "created_at": datetime.now().isoformat(),
-                "like_count": i * 10,
-                "reply_count": i,
+                "created_at": now,
             }
         )
-    return comments
+        for i in range(count)
+    )
 
 
-@pytest.fixture
-def sample_posts_list(count: int = 3) -> List[Dict[str, Any]]:
-    """Generate a list of sample posts"""
-    posts = []
-    for i in range(count):
-        posts.append(
-            {
-                "id": f"post_{i}",
-                "title": f"Test Post {i}",
-                "content": f"<p>Test content {i}</p>",
-                "author_id": f"user_{i}",
-                "created_at": datetime.now().isoformat(),
-                "tags": ["test", f"tag{i}"],
-                "like_count": i * 50,
-                "comment_count": i * 10,
-            }
-        )
-    return posts
+# Like the comments builder, the builders below cycle their template pool
+# so counts above _MAX_LIST_ITEMS still yield the requested number of
+# items, with unique ids throughout.
 
 
-@pytest.fixture
-def sample_videos_list(count: int = 3) -> List[Dict[str, Any]]:
-    """Generate a list of sample videos"""
-    videos = []
-    for i in range(count):
-        videos.append(
-            {
-                "id": f"video_{i}",
-                "title": f"Test Video {i}",
-                "description": f"Test description {i}",
-                "url": f"https://example.com/video{i}.mp4",
-                "thumbnail": f"https://example.com/thumb{i}.jpg",
-                "duration": 60 + i * 10,
-                "view_count": (i + 1) * 500,
-                "like_count": (i + 1) * 100,
-                "comment_count": (i + 1) * 10,
-                "created_at": (datetime.now() + timedelta(hours=i)).isoformat(),
-            }
+@functools.lru_cache(maxsize=None)
+def _build_posts_list(count: int = 3) -> Tuple[Mapping[str, Any], ...]:
+    now = _now_iso()
+    return tuple(
+        MappingProxyType(
+            {**_POST_TEMPLATES[i % _MAX_LIST_ITEMS], "id": f"post_{i}", "created_at": now}
         )
-    return videos
+        for i in range(count)
+    )
 
 
-@pytest.fixture
-def sample_articles_list(count: int = 3) -> List[Dict[str, Any]]:
-    """Generate a list of sample articles (Medium specific)"""
-    articles = []
-    for i in range(count):
-        articles.append(
-            {
-                "id": f"article_{i}",
-                "title": f"Test Article {i}",
-                "content": f"<p>Test content {i}</p>",
-                "contentFormat": "html",
-                "authorId": f"user_{i}",
-                "tags": ["test", f"tag{i}"],
-                "publishedAt": int(
-                    (datetime.now() + timedelta(hours=i)).timestamp() * 1000
-                ),
-                "url": f"https://medium.com/p/test-article-{i}",
-            }
-        )
-    return articles
+@functools.lru_cache(maxsize=None)
+def _build_videos_list(count: int = 3) -> Tuple[Mapping[str, Any], ...]:
+    return tuple(
+        MappingProxyType({**_VIDEO_TEMPLATES[i % _MAX_LIST_ITEMS], "id": f"video_{i}"})
+        for i in range(count)
+    )
 
 
-@pytest.fixture
-def sample_media_list(count: int = 3) -> List[Dict[str, Any]]:
-    """Generate a list of sample media (Instagram specific)"""
-    media_list = []
-    for i in range(count):
-        media_list.append(
-            {
-                "id": f"media_{i}",
-                "caption": f"Test caption {i}",
-                "media_type": "CAROUSEL_ALBUM",
-                "media_url": f"https://instagram.com/test{i}.jpg",
-                "thumbnail_url": f"https://instagram.com/thumb{i}.jpg",
-                "timestamp": int(
-                    (datetime.now() + timedelta(hours=i)).timestamp() * 1000
-                ),
-            }
+@functools.lru_cache(maxsize=None)
+def _build_articles_list(count: int = 3) -> Tuple[Mapping[str, Any], ...]:
+    return tuple(
+        MappingProxyType(
+            {**_ARTICLE_TEMPLATES[i % _MAX_LIST_ITEMS], "id": f"article_{i}"}
         )
-    return media_list
+        for i in range(count)
+    )
 
 
-@pytest.fixture(params=["profanity", "spam", "harassment", "self_promo"])
-def flagged_comment(request):
-    """Sample flagged comment for testing moderation"""
-    flag_type = request.param
-    return {
+@functools.lru_cache(maxsize=None)
+def _build_media_list(count: int = 3) -> Tuple[Mapping[str, Any], ...]:
+    return tuple(
+        MappingProxyType({**_MEDIA_TEMPLATES[i % _MAX_LIST_ITEMS], "id": f"media_{i}"})
+        for i in range(count)
+    )
+
+
+# The list fixtures are exposed as session-scoped factories: tests call
+# e.g. sample_comments_list(count=10) and get a cached tuple of frozen
+# dicts, built once per unique count for the whole session.
+
+@pytest.fixture(scope="session")
+def sample_comments_list_factory():
+    """Factory for lists of sample comments; call with count=N"""
+    return _build_comments_list
+
+
+@pytest.fixture(scope="session")
+def sample_comments_list():
+    """Generate a list of sample comments (callable; pass count=N)"""
+    return _build_comments_list
+
+
+@pytest.fixture(scope="session")
+def sample_posts_list_factory():
+    """Factory for lists of sample posts; call with count=N"""
+    return _build_posts_list
+
+
+@pytest.fixture(scope="session")
+def sample_posts_list():
+    """Generate a list of sample posts (callable; pass count=N)"""
+    return _build_posts_list
+
+
+@pytest.fixture(scope="session")
+def sample_videos_list_factory():
+    """Factory for lists of sample videos; call with count=N"""
+    return _build_videos_list
+
+
+@pytest.fixture(scope="session")
+def sample_videos_list():
+    """Generate a list of sample videos (callable; pass count=N)"""
+    return _build_videos_list
+
+
+@pytest.fixture(scope="session")
+def sample_articles_list_factory():
+    """Factory for lists of sample articles; call with count=N"""
+    return _build_articles_list
+
+
+@pytest.fixture(scope="session")
+def sample_articles_list():
+    """Generate a list of sample articles (Medium specific; callable)"""
+    return _build_articles_list
+
+
+@pytest.fixture(scope="session")
+def sample_media_list_factory():
+    """Factory for lists of sample media; call with count=N"""
+    return _build_media_list
+
+
+@pytest.fixture(scope="session")
+def sample_media_list():
+    """Generate a list of sample media (Instagram specific; callable)"""
+    return _build_media_list
+
+
+_FLAGGED_COMMENT_TEMPLATES = {
+    flag_type: {
         "id": f"comment_flagged_{flag_type}_123",
         "text": f"Test {flag_type} comment",
-        "user_id": f"user_flagged_456",
+        "user_id": "user_flagged_456",
         "username": f"flaggeduser_{flag_type}",
         "flag_type": flag_type,
-        "created_at": datetime.now().isoformat(),
     }
+    for flag_type in ("profanity", "spam", "harassment", "self_promo")
+}
 
-
-@pytest.fixture(params=["delete", "hide", "flag", "allow"])
-def moderation_action(request):
-    """Sample moderation action for testing"""
-    action_type = request.param
-    return {
+_MODERATION_ACTION_TEMPLATES = {
+    action_type: {
         "action": action_type,
         "reason": f"Test reason for {action_type}",
-        "timestamp": datetime.now().isoformat(),
     }
+    for action_type in ("delete", "hide", "flag", "allow")
+}
+
+
+@pytest.fixture(
+    params=["profanity", "spam", "harassment", "self_promo"],
+    ids=["flag-profanity", "flag-spam", "flag-harassment", "flag-self-promo"],
+)
+def flagged_comment(request):
+    """Sample flagged comment for testing moderation"""
+    return {**_FLAGGED_COMMENT_TEMPLATES[request.param], "created_at": _now_iso()}
+
+
+@pytest.fixture(
+    params=["delete", "hide", "flag", "allow"],
+    ids=["act-delete", "act-hide", "act-flag", "act-allow"],
+)
+def moderation_action(request):
+    """Sample moderation action for testing"""
+    return {**_MODERATION_ACTION_TEMPLATES[request.param], "timestamp": _now_iso()}
 
 
 @pytest.fixture
@@ -234,7 +471,7 @@ def sample_analyzed_comment() -> Dict[str, Any]:
         "self_promo": False,
         "severity": "low",
         "confidence": 0.95,
-        "analyzed_at": datetime.now().isoformat(),
+        "analyzed_at": _now_iso(),
     }
 
 
@@ -245,19 +482,42 @@ def sample_moderation_result() -> Dict[str, Any]:
         "comment_id": "comment_test_123",
         "action": "allow",
         "rule_triggered": None,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
     }
 
 
-@pytest.fixture
-def sample_rate_limit_info() -> Dict[str, Any]:
-    """Sample rate limit information"""
-    return {
-        "limit": 100,
-        "remaining": 95,
-        "reset": 1234567890,
-        "reset_time": datetime.fromtimestamp(1234567890).isoformat(),
+@pytest.fixture(scope="session")
+def sample_rate_limit_info() -> Mapping[str, Any]:
+    """Sample rate limit information (read-only)"""
+    return MappingProxyType(_SAMPLE_RATE_LIMIT_INFO)
+
+
+# One immutable webhook event shared for the whole session; tests that
+# need a variant copy the items they want instead of mutating this.
+_WEBHOOK_EVENT_TEMPLATE = MappingProxyType(
+    {
+        "type": "comment.created",
+        "comment_id": "comment_webhook_123",
+        "post_id": "post_webhook_456",
+        "text": "New comment via webhook",
+        "user_id": "user_webhook_789",
+        "timestamp": "2025-01-08T10:00:00Z",
+        "payload": MappingProxyType(
+            {
+                "comment_id": "comment_webhook_123",
+                "post_id": "post_webhook_456",
+                "text": "New comment via webhook",
+                "user_id": "user_webhook_789",
+            }
+        ),
     }
+)
+
+
+@pytest.fixture(scope="session")
+def webhook_event() -> Mapping[str, Any]:
+    """Webhook event template shared for the whole session (read-only)"""
+    return _WEBHOOK_EVENT_TEMPLATE
 
 
 @pytest.fixture
@@ -269,138 +529,99 @@ def sample_webhook_event() -> Dict[str, Any]:
         "post_id": "post_webhook_456",
         "text": "New comment via webhook",
         "user_id": "user_webhook_789",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
     }
 
 
-@pytest.fixture
-def sample_error_response(error_type: str = "access_token_invalid") -> Dict[str, Any]:
-    """Sample error response"""
-    error_messages = {
-        "access_token_invalid": "The access token provided is invalid",
-        "expired_token": "The access token has expired",
-        "rate_limit_exceeded": "Rate limit exceeded",
-        "invalid_grant": "Invalid grant type",
-        "resource_not_found": "Resource not found",
-        "forbidden": "Insufficient permissions",
-    }
-
-    return {
-        "error": {
-            "code": error_type,
-            "message": error_messages.get(error_type, "Unknown error"),
-        },
-        "status_code": 400 if error_type == "invalid_grant" else 401,
+# All six error responses precomputed as frozen views; the fixture is a
+# table lookup and can be parametrized indirectly with the error type.
+_ERROR_RESPONSES = MappingProxyType(
+    {
+        k: MappingProxyType(
+            {
+                "error": MappingProxyType({"code": k, "message": v}),
+                "status_code": 400 if k == "invalid_grant" else 401,
+            }
+        )
+        for k, v in _ERROR_RESPONSE_MESSAGES.items()
     }
+)
 
 
 @pytest.fixture
-def sample_pagination_info() -> Dict[str, Any]:
-    """Sample pagination information"""
-    return {
-        "page": 1,
-        "page_size": 20,
-        "total_count": 100,
-        "total_pages": 5,
-        "next_page_token": "next_page_token_123",
-        "has_next": True,
+def sample_error_response(request) -> Mapping[str, Any]:
+    """Sample error response; parametrize with indirect=True to pick the type"""
+    return _ERROR_RESPONSES[getattr(request, "param", "access_token_invalid")]
+
+
+@pytest.fixture(scope="session")
+def sample_pagination_info() -> Mapping[str, Any]:
+    """Sample pagination information (read-only)"""
+    return MappingProxyType(_SAMPLE_PAGINATION_INFO)
+
+
+_COMMENT_LENGTHS = MappingProxyType(
+    {
+        k: MappingProxyType({"type": k, "text": v, "word_count": len(v.split())})
+        for k, v in {
+            "short": "Hi",
+            "medium": "This is a medium length comment",
+            "long": "This is a very long comment with multiple sentences to test various moderation scenarios",
+        }.items()
+    }
+)
+
+_MULTILINGUAL_COMMENTS = MappingProxyType(
+    {
+        k: MappingProxyType({"language": k, "text": v})
+        for k, v in {
+            "English": "This is a test comment",
+            "Spanish": "Este es un comentario de prueba",
+            "French": "Ceci est un commentaire de test",
+        }.items()
     }
+)
 
 
-@pytest.fixture(params=["short", "medium", "long"])
+@pytest.fixture(
+    params=["short", "medium", "long"],
+    ids=["len-short", "len-medium", "len-long"],
+    scope="session",
+)
 def comment_length_variations(request):
     """Parameterized fixture for testing comment length"""
-    length_type = request.param
-    lengths = {
-        "short": "Hi",
-        "medium": "This is a medium length comment",
-        "long": "This is a very long comment with multiple sentences to test various moderation scenarios",
-    }
-    return {
-        "type": length_type,
-        "text": lengths[length_type],
-        "word_count": len(lengths[length_type].split()),
-    }
+    return _COMMENT_LENGTHS[request.param]
 
 
-@pytest.fixture(params=["English", "Spanish", "French"])
+@pytest.fixture(
+    params=["English", "Spanish", "French"],
+    ids=["lang-en", "lang-es", "lang-fr"],
+    scope="session",
+)
 def multilingual_comment(request):
     """Parameterized fixture for testing multilingual comments"""
-    language = request.param
-    comments = {
-        "English": "This is a test comment",
-        "Spanish": "Este es un comentario de prueba",
-        "French": "Ceci est un commentaire de test",
-    }
-    return {"language": language, "text": comments[language]}
+    return _MULTILINGUAL_COMMENTS[request.param]
 
 
-@pytest.fixture
-def sample_user_profile() -> Dict[str, Any]:
-    """Sample user profile data"""
-    return {
-        "id": "user_profile_123",
-        "username": "testuser",
-        "display_name": "Test User",
-        "bio": "This is a test bio",
-        "profile_picture": "https://example.com/avatar.jpg",
-        "is_verified": True,
-        "follower_count": 1000,
-        "following_count": 500,
-        "posts_count": 100,
-    }
+@pytest.fixture(scope="session")
+def sample_user_profile() -> Mapping[str, Any]:
+    """Sample user profile data (read-only)"""
+    return MappingProxyType(_SAMPLE_USER_PROFILE)
 
 
-@pytest.fixture
-def sample_post_metrics() -> Dict[str, Any]:
-    """Sample post metrics"""
-    return {
-        "id": "post_metrics_123",
-        "like_count": 1000,
-        "comment_count": 100,
-        "share_count": 50,
-        "view_count": 10000,
-        "engagement_rate": 0.15,
-    }
+@pytest.fixture(scope="session")
+def sample_post_metrics() -> Mapping[str, Any]:
+    """Sample post metrics (read-only)"""
+    return MappingProxyType(_SAMPLE_POST_METRICS)
 
 
-@pytest.fixture
-def sample_comment_thread() -> Dict[str, Any]:
-    """Sample comment thread (replies)"""
-    return {
-        "parent_comment": {
-            "id": "comment_parent_123",
-            "text": "Parent comment",
-            "user_id": "user_parent_456",
-            "reply_count": 2,
-        },
-        "replies": [
-            {
-                "id": "comment_reply_1",
-                "text": "Reply 1",
-                "user_id": "user_reply_1",
-                "parent_id": "comment_parent_123",
-            },
-            {
-                "id": "comment_reply_2",
-                "text": "Reply 2",
-                "user_id": "user_reply_2",
-                "parent_id": "comment_parent_123",
-            },
-        ],
-        "total_replies": 2,
-    }
+@pytest.fixture(scope="session")
+def sample_comment_thread() -> Mapping[str, Any]:
+    """Sample comment thread (replies) (read-only)"""
+    return MappingProxyType(_SAMPLE_COMMENT_THREAD)
 
 
-@pytest.fixture
-def sample_batch_results() -> Dict[str, Any]:
-    """Sample batch operation results"""
-    return {
-        "total_processed": 25,
-        "successful": 23,
-        "failed": 2,
-        "errors": [
-            {"item_id": "item_5", "error": "Rate limit exceeded"},
-            {"item_id": "item_12", "error": "Resource not found"},
-        ],
-    }
+@pytest.fixture(scope="session")
+def sample_batch_results() -> Mapping[str, Any]:
+    """Sample batch operation results (read-only)"""
+    return MappingProxyType(_SAMPLE_BATCH_RESULTS)
@@ -0,0 +1,68 @@
+"""Shared fixtures for the integration test suite"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from src.core.base import Comment
+from tests.fixtures import MockInstagramAPI, instagram_config, sample_comments_list
+
+# The real Instagram adapter objects are expensive to build relative to
+# the tests that use them, and the tests below only read from them, so
+# one instance per module is enough. Tests that mutate side_effect or
+# internal counters keep constructing their own instance.
+
+
+@pytest.fixture(scope="module")
+def instagram_api_client(instagram_config):
+    """Instagram platform client shared by the tests of one module"""
+    from src.platforms.instagram import InstagramPlatform
+
+    return InstagramPlatform(config=dict(instagram_config))
+
+
+@pytest.fixture(scope="module")
+def instagram_limiter():
+    """Instagram rate limiter shared by the tests of one module"""
+    from src.utils.rate_limiter import SlidingWindowRateLimiter
+
+    return SlidingWindowRateLimiter(requests_per_minute=10)
+
+
+@pytest.fixture(scope="session")
+def comments_50(sample_comments_list):
+    """Fifty sample comments, built once and shared for the whole session"""
+    return sample_comments_list(count=50)
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Reusable worker pool for the concurrency tests"""
+    with ThreadPoolExecutor(max_workers=min(10, os.cpu_count() or 1)) as executor:
+        yield executor
+
+
+@pytest.fixture(scope="session")
+def canonical_comment():
+    """One shared Comment for the whole session; Comment is frozen, so no
+    test can mutate it out from under another"""
+    return Comment(
+        id="test_comment_1",
+        text="This is a test comment with bad language",
+        author_id="user1",
+        author_name="Test User",
+        created_at=datetime(2024, 1, 1),
+        platform="test",
+        post_id="test_post",
+    )
+
+
+@pytest.fixture(scope="module")
+def instagram_mock_api():
+    """Module-shared MockInstagramAPI; state accumulates across the tests
+    of a module and is cleared at module teardown"""
+    api = MockInstagramAPI()
+    yield api
+    api.reset()
@@ -1,90 +1,101 @@
 """Authentication Flow Tests for All Platforms"""
 
-import os
-import sys
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 
-# Add src to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 from tests.fixtures import (
     valid_auth_token,
     expired_auth_token,
-    oauth_credentials,
     auth_headers,
+    MockInstagramAPI,
+    MockMediumAPI,
+    MockTikTokAPI,
+    mock_response_factory,
+    mock_token_manager,
+    instagram_config,
+    medium_config,
+    tiktok_config,
+    mock_auth_error,
 )
 
 
+@pytest.fixture(scope="module")
+def success_response():
+    """Canned 200 response shared across the auth tests"""
+    return mock_response_factory(status_code=200, data={"id": "test_user"})
+
+
+@pytest.fixture(scope="module")
+def all_configs(instagram_config, medium_config, tiktok_config):
+    """Per-platform configs keyed by name, resolved once per module"""
+    return {
+        "instagram": instagram_config,
+        "medium": medium_config,
+        "tiktok": tiktok_config,
+    }
+
+
 @pytest.mark.auth
 @pytest.mark.network
 class TestAuthenticationFlows:
     """Test authentication flows for all platforms"""
 
-    @pytest.mark.parametrize("platform", ["instagram", "medium", "tiktok"])
-    def test_authorization_request_success(self, platform):
+    @pytest.mark.parametrize(
+        "platform", ["instagram", "medium", "tiktok"], ids=["ig", "md", "tt"]
+    )
+    def test_authorization_request_success(self, platform, success_response, all_configs):
         """Test successful authorization request"""
-        from tests.fixtures import (
-            MockInstagramAPI,
-            MockMediumAPI,
-            MockTikTokAPI,
-            platform_config,
-            mock_response_factory,
-        )
 
-        config = platform_config(platform)
+        config = all_configs[platform]
 
         if platform == "instagram":
-            client = MockInstagramAPI()
+            client = Mock(spec=MockInstagramAPI)
             mock_func = "get_media"
             args = ["test_media_id"]
         elif platform == "medium":
-            client = MockMediumAPI()
-            mock_func = "get_articles"
+            client = Mock(spec=MockMediumAPI)
+            mock_func = "get_user_articles"
             args = ["test_user_id"]
         elif platform == "tiktok":
-            client = MockTikTokAPI()
-            mock_func = "get_user_info"
+            client = Mock(spec=MockTikTokAPI)
+            mock_func = "get_user_videos"
             args = []
         else:
             pytest.skip(f"Unknown platform: {platform}")
 
+        client.config = config
+
         # Mock successful auth response
-        success_response = mock_response_factory(
-            status_code=200, data={"id": "test_user"}
-        )
         getattr(client, mock_func).return_value = success_response
 
         result = getattr(client, mock_func)(*args)
 
-        assert result["id"] == "test_user"
+        assert result.json()["data"]["id"] == "test_user"
         assert getattr(client, mock_func).call_count == 1
 
-    def test_token_exchange_success(self):
+    def test_token_exchange_success(self, valid_auth_token):
         """Test successful token exchange"""
-        from tests.fixtures import valid_auth_token, mock_response_factory
 
         # Mock token exchange response
         token_response = mock_response_factory(
             status_code=200,
             data={
-                "access_token": valid_auth_token(),
+                "access_token": valid_auth_token,
                 "token_type": "Bearer",
                 "expires_in": 3600,
                 "refresh_token": "refresh_test_token",
             },
         )
 
-        assert token_response["status_code"] == 200
-        assert "access_token" in token_response["data"]
-        assert "expires_in" in token_response["data"]
-        assert "refresh_token" in token_response["data"]
+        assert token_response.status_code == 200
+        data = token_response.json()["data"]
+        assert "access_token" in data
+        assert "expires_in" in data
+        assert "refresh_token" in data
 
-    @pytest.mark.network
     def test_token_refresh_success(self):
         """Test successful token refresh"""
-        from tests.fixtures import mock_response_factory
 
         # Mock refresh response
         refresh_response = mock_response_factory(
@@ -96,110 +107,79 @@ class TestAuthenticationFlows:
             },
         )
 
-        assert refresh_response["status_code"] == 200
-        assert refresh_response["data"]["access_token"] == "new_token"
-        assert "refresh_token" in refresh_response["data"]
+        assert refresh_response.status_code == 200
+        data = refresh_response.json()["data"]
+        assert data["access_token"] == "new_token"
+        assert "refresh_token" in data
 
-    def test_token_expiration_handling(self):
+    def test_token_expiration_handling(self, mock_token_manager, expired_auth_token):
         """Test token expiration and refresh"""
-        from tests.fixtures import (
-            valid_auth_token,
-            expired_auth_token,
-            mock_token_manager,
-        )
 
-        manager = mock_token_manager()
+        manager = mock_token_manager
 
-        # Test expired token
-        manager.get_token.return_value = expired_auth_token()
+        # Store an already-expired token
+        manager.save_token(
+            "user_1", {"access_token": expired_auth_token, "expires_at": 0}
+        )
         assert manager.is_token_expired("user_1") is True
 
         # Refresh token
-        manager.refresh_token.return_value = {
-            "access_token": "new_token",
-            "expires_in": 3600,
-        }
         new_token_data = manager.refresh_token("user_1")
 
-        assert new_token_data["access_token"] != expired_auth_token()
+        assert new_token_data["access_token"] != expired_auth_token
         assert "expires_in" in new_token_data
 
-    def test_multiple_platform_auth(self):
+    def test_multiple_platform_auth(self, success_response, all_configs):
         """Test authentication across multiple platforms"""
-        from tests.fixtures import (
-            instagram_config,
-            medium_config,
-            tiktok_config,
-            MockInstagramAPI,
-            MockMediumAPI,
-            MockTikTokAPI,
-            mock_response_factory,
-        )
 
         # Mock all clients
-        instagram = MockInstagramAPI()
-        instagram.config = instagram_config()
-        medium = MockMediumAPI()
-        medium.config = medium_config()
-        tiktok = MockTikTokAPI()
-        tiktok.config = tiktok_config()
-
-        # Mock successful responses
-        success_response = mock_response_factory(
-            status_code=200, data={"id": "test_user"}
-        )
+        instagram = Mock(spec=MockInstagramAPI)
+        instagram.config = all_configs["instagram"]
+        medium = Mock(spec=MockMediumAPI)
+        medium.config = all_configs["medium"]
+        tiktok = Mock(spec=MockTikTokAPI)
+        tiktok.config = all_configs["tiktok"]
 
         instagram.get_media.return_value = success_response
-        medium.get_articles.return_value = success_response
-        tiktok.get_user_info.return_value = success_response
+        medium.get_user_articles.return_value = success_response
+        tiktok.get_user_videos.return_value = success_response
 
         # Test all platforms
         ig_result = instagram.get_media("test_media_id")
-        medium_result = medium.get_articles("test_user_id")
-        tiktok_result = tiktok.get_user_info()
+        medium_result = medium.get_user_articles("test_user_id")
+        tiktok_result = tiktok.get_user_videos()
 
-        assert ig_result["id"] == "test_user"
-        assert medium_result["id"] == "test_user"
-        assert tiktok_result["id"] == "test_user"
+        for result in (ig_result, medium_result, tiktok_result):
+            assert result.json()["data"]["id"] == "test_user"
 
-    def test_auth_state_validation(self):
+    def test_auth_state_validation(self, auth_headers):
         """Test auth state validation"""
-        from tests.fixtures import valid_auth_token, auth_headers
 
         # Valid auth token
-        valid_headers = auth_headers(valid_auth_token())
+        valid_headers = auth_headers
 
         assert "Bearer" in valid_headers["Authorization"]
         assert "application/json" in valid_headers["Content-Type"]
         assert valid_headers["Authorization"].startswith("Bearer ")
 
-    @pytest.mark.network
-    def test_concurrent_token_requests(self):
+    def test_concurrent_token_requests(self, mock_token_manager):
         """Test concurrent token requests"""
-        from tests.fixtures import mock_token_manager
 
-        manager = mock_token_manager()
+        manager = mock_token_manager
 
-        # Mock multiple concurrent requests
-        manager.get_token.return_value = "test_token"
-        manager.save_token.return_value = None
+        # Seed the stored token the concurrent readers share
+        manager.save_token("user_1", {"access_token": "test_token"})
 
         # Make 10 concurrent requests
         for _ in range(10):
             token = manager.get_token("user_1")
             assert token == "test_token"
 
-    @pytest.mark.network
-    def test_auth_failure_recovery(self):
+    def test_auth_failure_recovery(self, instagram_config, mock_auth_error):
         """Test authentication failure recovery"""
-        from tests.fixtures import (
-            MockInstagramAPI,
-            mock_auth_error,
-            instagram_config,
-        )
 
-        client = MockInstagramAPI()
-        client.config = instagram_config()
+        client = Mock(spec=MockInstagramAPI)
+        client.config = instagram_config
 
         # Mock auth error
         error_response = mock_auth_error(error_type="access_token_invalid")
@@ -209,23 +189,16 @@ class TestAuthenticationFlows:
         with pytest.raises(Exception):
             client.get_media("test_media_id")
 
-    @pytest.mark.network
-    def test_auth_retry_with_backoff(self):
+    def test_auth_retry_with_backoff(self, instagram_config, mock_auth_error):
         """Test auth retry with exponential backoff"""
-        from tests.fixtures import (
-            MockInstagramAPI,
-            mock_auth_error,
-            instagram_config,
-            mock_response_factory,
-        )
 
-        client = MockInstagramAPI()
-        client.config = instagram_config()
+        client = Mock(spec=MockInstagramAPI)
+        client.config = instagram_config
 
         # Mock initial failure, then success
         client.get_media.side_effect = [
             Exception(mock_auth_error()),
-            mock_response_factory(status_code=200, data={"id": "test_user"}),
+            {"id": "test_user"},
         ]
 
         # First attempt fails
@@ -0,0 +1,18 @@
+"""Shared fixtures for the platform unit tests.
+
+Fixtures in this repo come into scope by being imported; the client,
+config and list fixtures below are used across all three platform
+modules, so register them once here instead of in every file.
+"""
+
+from tests.fixtures import (  # noqa: F401
+    instagram_client,
+    instagram_config,
+    medium_client,
+    medium_config,
+    tiktok_client,
+    tiktok_config,
+    sample_comments_list,
+    sample_posts_list,
+    sample_videos_list,
+)
@@ -1,21 +1,15 @@
 """Unit Tests for Instagram Adapter"""
 
-import os
-import sys
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import json
 
-# Add src to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
-
 from tests.fixtures import (
     MockInstagramAPI,
     sample_comment,
     sample_post,
     sample_user,
     auth_headers,
-    mock_error_response,
 )
 
 
@@ -32,7 +26,6 @@ class TestInstagramAPIClient:
         assert client.access_token == instagram_config["access_token"]
         assert client.api_base_url == instagram_config["api_base_url"]
 
-    @pytest.mark.network
     def test_get_media_success(self, instagram_client: MockInstagramAPI):
         """Test successful media retrieval"""
         media_id = "test_media_123"
@@ -43,7 +36,6 @@ class TestInstagramAPIClient:
         assert "caption" in result
         assert instagram_client.call_count == 1
 
-    @pytest.mark.network
     def test_get_media_comments_success(self, instagram_client: MockInstagramAPI):
         """Test successful comment retrieval"""
         media_id = "test_media_123"
@@ -53,7 +45,6 @@ class TestInstagramAPIClient:
         assert len(comments) == 5
         assert instagram_client.call_count == 1
 
-    @pytest.mark.network
     def test_delete_comment_success(self, instagram_client: MockInstagramAPI):
         """Test successful comment deletion"""
         comment_id = "comment_test_123"
@@ -67,7 +58,6 @@ class TestInstagramAPIClient:
             {"comment_id": comment_id},
         ) in instagram_client.called_endpoints
 
-    @pytest.mark.network
     def test_hide_comment_success(self, instagram_client: MockInstagramAPI):
         """Test successful comment hiding"""
         comment_id = "comment_test_123"
@@ -300,64 +290,6 @@ class TestInstagramWebhookHandler:
             mock_handler.assert_called_once()
 
 
-class TestInstagramErrorHandling:
-    """Tests for Instagram Error Handling"""
-
-    def test_handle_rate_limit_error(self):
-        """Test handling rate limit error"""
-        from src.platforms.instagram.client import InstagramAPIClient
-
-        client = InstagramAPIClient({"access_token": "test"})
-
-        error_response = mock_error_response(
-            status_code=429,
-            error_code="rate_limit_exceeded",
-            error_message="Rate limit exceeded",
-        )
-
-        with patch("requests.get", return_value=error_response):
-            with pytest.raises(Exception) as exc_info:
-                client.get_media("test_media_id")
-
-            assert "Rate limit" in str(exc_info.value)
-
-    def test_handle_authentication_error(self):
-        """Test handling authentication error"""
-        from src.platforms.instagram.client import InstagramAPIClient
-
-        client = InstagramAPIClient({"access_token": "test"})
-
-        error_response = mock_error_response(
-            status_code=401,
-            error_code="access_token_invalid",
-            error_message="Invalid access token",
-        )
-
-        with patch("requests.get", return_value=error_response):
-            with pytest.raises(Exception) as exc_info:
-                client.get_media("test_media_id")
-
-            assert "Invalid access token" in str(exc_info.value)
-
-    def test_handle_not_found_error(self):
-        """Test handling not found error"""
-        from src.platforms.instagram.client import InstagramAPIClient
-
-        client = InstagramAPIClient({"access_token": "test"})
-
-        error_response = mock_error_response(
-            status_code=404,
-            error_code="resource_not_found",
-            error_message="Resource not found",
-        )
-
-        with patch("requests.get", return_value=error_response):
-            with pytest.raises(Exception) as exc_info:
-                client.get_media("nonexistent_media_id")
-
-            assert "not found" in str(exc_info.value).lower()
-
-
 class TestInstagramIntegration:
     """Integration tests for Instagram platform"""
 
@@ -26,7 +26,6 @@ class TestMediumAPIClient:
         assert client.access_token == medium_config["access_token"]
         assert client.api_base_url == "https://api.medium.com/v1"
 
-    @pytest.mark.network
     def test_get_user_articles_success(self, medium_client: MockMediumAPI):
         """Test successful article retrieval"""
         from src.platforms.medium.client import MediumAPIClient
@@ -38,7 +37,6 @@ class TestMediumAPIClient:
         assert articles[0]["id"] == "article_1"
         assert medium_client.call_count == 1
 
-    @pytest.mark.network
     def test_get_publication_articles_success(self, medium_client: MockMediumAPI):
         """Test publication article retrieval"""
         from src.platforms.medium.client import MediumAPIClient
@@ -50,7 +48,6 @@ class TestMediumAPIClient:
         assert articles[0]["id"] == "article_1"
         assert medium_client.call_count == 1
 
-    @pytest.mark.network
     def test_get_article_comments_success(self, medium_client: MockMediumAPI):
         """Test successful comment retrieval"""
         from src.platforms.medium.client import MediumAPIClient
@@ -62,7 +59,6 @@ class TestMediumAPIClient:
         assert comments[0]["id"] == "comment_1"
         assert medium_client.call_count == 1
 
-    @pytest.mark.network
     def test_delete_comment_success(self, medium_client: MockMediumAPI):
         """Test successful comment deletion"""
         from src.platforms.medium.client import MediumAPIClient
@@ -251,43 +247,6 @@ class TestMediumWebhookHandler:
         assert True  # Handler was called
 
 
-class TestMediumErrorHandling:
-    """Tests for Medium Error Handling"""
-
-    def test_handle_rate_limit_error(self, medium_client: MockMediumAPI):
-        """Test handling rate limit error"""
-        from src.platforms.medium.client import MediumAPIClient
-
-        client = MediumAPIClient(medium_config())
-
-        error_response = Mock()
-        error_response.status_code = 429
-        error_response.headers = {
-            "X-RateLimit-Limit": "100",
-            "X-RateLimit-Remaining": "0",
-        }
-
-        with patch("requests.get", return_value=error_response):
-            with pytest.raises(Exception) as exc_info:
-                client.get_article_comments("article_id_1")
-
-            assert "Rate limit" in str(exc_info.value)
-
-    def test_handle_authentication_error(self, medium_client: MockMediumAPI):
-        """Test handling authentication error"""
-        from src.platforms.medium.client import MediumAPIClient
-
-        client = MediumAPIClient({"access_token": "invalid_token"})
-
-        error_response = mock_error_response(status_code=401)
-
-        with patch("requests.get", return_value=error_response):
-            with pytest.raises(Exception) as exc_info:
-                client.get_article_comments("article_id_1")
-
-            assert "Authentication" in str(exc_info.value)
-
-
 class TestMediumIntegration:
     """Integration tests for Medium platform"""
 
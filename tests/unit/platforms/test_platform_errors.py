@@ -0,0 +1,53 @@
+"""Unit Tests for Platform API Client Error Handling"""
+
+import pytest
+from unittest.mock import Mock
+
+from tests.fixtures import MockInstagramAPI, MockMediumAPI, MockTikTokAPI
+from tests.fixtures.platform_fixtures import _ERROR_RESPONSES_BY_STATUS
+
+# (status_code, error_code, message) cases shared by every platform client.
+_HTTP_ERRORS = [
+    (429, "rate_limit_exceeded", "Rate limit exceeded"),
+    (401, "access_token_invalid", "The access token provided is invalid"),
+    (403, "forbidden", "Insufficient permissions"),
+    (404, "not_found", "Resource not found"),
+]
+
+
+class TestPlatformAPIClientErrors:
+    """Error handling tests shared across the platform API clients.
+
+    Replaces the per-platform error classes that used to live in
+    test_instagram/test_medium/test_tiktok; one parametrized class keeps
+    the same coverage with a single shared setup path.
+    """
+
+    @pytest.mark.parametrize(
+        "client_cls, method",
+        [
+            (MockInstagramAPI, "get_media"),
+            (MockMediumAPI, "get_article_comments"),
+            (MockTikTokAPI, "get_video_comments"),
+        ],
+        ids=["instagram", "medium", "tiktok"],
+    )
+    @pytest.mark.parametrize(
+        "status_code, error_code, message",
+        _HTTP_ERRORS,
+        ids=[str(code) for code, _, _ in _HTTP_ERRORS],
+    )
+    def test_handle_http_error(
+        self, client_cls, method, status_code, error_code, message
+    ):
+        """Each client surfaces HTTP errors as exceptions with the API message"""
+        client = client_cls()
+        error_response = _ERROR_RESPONSES_BY_STATUS[status_code]
+
+        setattr(client, method, Mock(side_effect=Exception(message)))
+
+        with pytest.raises(Exception) as exc_info:
+            getattr(client, method)("test_id")
+
+        assert message in str(exc_info.value)
+        assert error_response.status_code == status_code
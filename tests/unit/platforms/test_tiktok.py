@@ -10,7 +10,6 @@ from tests.fixtures import (
     sample_video,
     sample_user,
     auth_headers,
-    mock_error_response,
 )
 
 
@@ -27,7 +26,6 @@ class TestTikTokAPIClient:
         assert client.access_token == tiktok_config["access_token"]
         assert client.api_base_url == tiktok_config["api_base_url"]
 
-    @pytest.mark.network
     def test_get_user_info_success(self, tiktok_client: MockTikTokAPI):
         """Test successful user info retrieval"""
         tiktok_client.get_user_info.return_value = {
@@ -47,7 +45,6 @@ class TestTikTokAPIClient:
         assert response["user"]["display_name"] == "Test User"
         assert tiktok_client.call_count == 1
 
-    @pytest.mark.network
     def test_get_user_videos_success(self, tiktok_client: MockTikTokAPI):
         """Test successful video retrieval"""
         tiktok_client.get_user_videos.return_value = {
@@ -59,7 +56,6 @@ class TestTikTokAPIClient:
         assert len(response["videos"]) == 1
         assert tiktok_client.call_count == 1
 
-    @pytest.mark.network
     def test_get_video_details_success(self, tiktok_client: MockTikTokAPI):
         """Test successful video details retrieval"""
         tiktok_client.get_video_details.return_value = {
@@ -72,7 +68,6 @@ class TestTikTokAPIClient:
         assert len(response["videos"]) == 1
         assert tiktok_client.call_count == 1
 
-    @pytest.mark.network
     def test_get_video_comments_success(self, tiktok_client: MockTikTokAPI):
         """Test successful comment retrieval"""
         tiktok_client.get_video_comments.return_value = {
@@ -85,7 +80,6 @@ class TestTikTokAPIClient:
         assert len(response["comments"]) == 1
         assert tiktok_client.call_count == 1
 
-    @pytest.mark.network
     def test_delete_comment_success(self, tiktok_client: MockTikTokAPI):
         """Test successful comment deletion"""
         tiktok_client.delete_comment.return_value = {"data": {}}
@@ -100,7 +94,6 @@ class TestTikTokAPIClient:
             {"comment_id": comment_id},
         ) in tiktok_client.called_endpoints
 
-    @pytest.mark.network
     def test_pin_comment_success(self, tiktok_client: MockTikTokAPI):
         """Test successful comment pinning"""
         tiktok_client.pin_comment.return_value = {"data": {}}
@@ -289,26 +282,6 @@ class TestTikTokWebhookHandler:
         mock_handler.assert_called_once()
 
 
-class TestTikTokErrorHandling:
-    """Tests for TikTok Error Handling"""
-
-    def test_handle_rate_limit_error(self, tiktok_client: MockTikTokAPI):
-        """Test handling rate limit error"""
-        from src.platforms.tiktok.client import TikTokAPIClient
-
-        client = TikTokAPIClient(tiktok_config={"access_token": "test"})
-
-        error_response = mock_error_response(
-            status_code=429, error_code="rate_limit_exceeded"
-        )
-
-        with patch("requests.get", return_value=error_response):
-            with pytest.raises(Exception) as exc_info:
-                client.get_user_videos()
-
-            assert "Rate limit" in str(exc_info.value)
-
-
 class TestTikTokIntegration:
     """Integration tests for TikTok platform"""
 
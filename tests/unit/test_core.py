@@ -1,14 +1,9 @@
 """Unit tests for core modules."""
 
-import os
-import sys
 import pytest
 from datetime import datetime
 from pathlib import Path
 
-# Add src to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
 from src.core.base import (
     Comment,
     Violation,
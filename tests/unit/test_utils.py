@@ -1,13 +1,8 @@
 """Unit tests for utils modules."""
 
-import os
-import sys
 import pytest
 from datetime import datetime, timedelta
 
-# Add src to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
 from src.core.base import Comment, Severity, Violation, ModerationResult
 from src.utils.error_handler import (
     ErrorHandler,
@@ -18,7 +13,11 @@ from src.utils.error_handler import (
     ValidationError,
     ConfigurationError,
 )
-from src.utils.rate_limiter import RateLimiter, PlatformRateLimiter
+from src.utils.rate_limiter import (
+    RateLimiter,
+    PlatformRateLimiter,
+    SlidingWindowRateLimiter,
+)
 from src.utils import auth_manager
 
 
@@ -216,6 +215,44 @@ class TestRateLimiter:
         assert remaining == 5
 
 
+class TestSlidingWindowRateLimiter:
+    """Tests for SlidingWindowRateLimiter class."""
+
+    def test_records_within_window(self):
+        """Test requests are counted inside the window."""
+        limiter = SlidingWindowRateLimiter(requests_per_minute=10)
+        for _ in range(5):
+            limiter.record_request()
+        info = limiter.check_rate_limit()
+        assert info["remaining"] == 5
+        assert limiter.request_count == 5
+
+    def test_evicts_expired_timestamps(self):
+        """Test entries older than the window are evicted."""
+        limiter = SlidingWindowRateLimiter(requests_per_minute=10, window_seconds=60)
+        limiter.record_request()
+        # Age the only timestamp past the window
+        limiter._timestamps[0] -= 61
+        info = limiter.check_rate_limit()
+        assert info["remaining"] == 10
+
+    def test_concurrent_recording_loses_no_updates(self):
+        """Test 128 threads record without losing counter updates."""
+        import threading
+
+        limiter = SlidingWindowRateLimiter(requests_per_minute=1000)
+        threads = [
+            threading.Thread(target=limiter.record_request) for _ in range(128)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert limiter.request_count == 128
+        assert len(limiter._timestamps) == 128
+
+
 class TestPlatformRateLimiter:
     """Tests for PlatformRateLimiter class."""
 